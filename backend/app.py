@@ -6,32 +6,243 @@ Uses REAL MLB Statcast data from Baseball Savant.
 """
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import numpy as np
 import pandas as pd
-from szas_calculator import SZASCalculator
+import pyarrow as pa
+from szas_calculator import SZASCalculator, NUMBA_PARALLEL
 from bayesian_calculator import BayesianInfluenceCalculator
 from data_loader import DataLoader
 import os
+import io
+import json
+import struct
+import gzip
+import hashlib
+import threading
 import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+from collections import OrderedDict
+from functools import lru_cache, wraps
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Try to import orjson for faster response serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.info("orjson not available - using stdlib json (install with: pip install orjson)")
+
+# Try to import numba for the pitch-count kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _count_matching(batter, umpire, stand, counts, batter_id, umpire_id, side_code):
+    """Sum counts over cells matching the filters (-1 means 'any')"""
+    total = 0
+    for i in prange(batter.shape[0]):
+        if ((batter_id < 0 or batter[i] == batter_id)
+                and (umpire_id < 0 or umpire[i] == umpire_id)
+                and (side_code < 0 or stand[i] == side_code)):
+            total += counts[i]
+    return total
+
+
+if NUMBA_AVAILABLE:
+    # szas_calculator selected a threadsafe threading layer, or found none
+    _count_matching = njit(parallel=NUMBA_PARALLEL, cache=True)(_count_matching)
+else:
+    def _count_matching(batter, umpire, stand, counts, batter_id, umpire_id, side_code):
+        """Vectorized fallback for the numba kernel"""
+        mask = np.ones(batter.shape[0], dtype=bool)
+        for values, wanted in ((batter, batter_id), (umpire, umpire_id), (stand, side_code)):
+            if wanted >= 0:
+                mask &= values == wanted
+        return counts[mask].sum()
+
+
+class SZASJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider used by jsonify.
+
+    Serializes with orjson when installed (numpy arrays and scalars are
+    encoded natively, without boxing to Python floats first) and falls back
+    to the stdlib encoder otherwise. Both paths accept numpy values.
+    """
+
+    ORJSON_OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+    ) if ORJSON_AVAILABLE else 0
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        if isinstance(o, np.generic):
+            return o.item()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs):
+        if ORJSON_AVAILABLE and not kwargs:
+            return orjson.dumps(obj, default=self.default, option=self.ORJSON_OPTIONS).decode()
+        return super().dumps(obj, **kwargs)
+
+    def dumps_bytes(self, obj) -> bytes:
+        """Encode straight to a response body, skipping the str round trip"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(obj, default=self.default, option=self.ORJSON_OPTIONS)
+        return super().dumps(obj).encode()
+
+    def response(self, *args, **kwargs):
+        if not ORJSON_AVAILABLE:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = SZASJSONProvider(app)
+
+
+ARROW_STREAM_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+
+def _split_arrays(payload: dict) -> tuple:
+    """
+    Separate the numpy arrays in a (nested) payload from everything else.
+
+    Returns ([(dotted_name, array), ...], meta) where meta mirrors the
+    payload's nesting with the arrays removed. Float arrays are cast to
+    float32 for the wire.
+    """
+    arrays = []
+    meta = {}
+
+    def walk(obj, prefix, target):
+        for key, value in obj.items():
+            name = f"{prefix}{key}"
+            if isinstance(value, np.ndarray):
+                if value.dtype.kind == 'f':
+                    value = value.astype(np.float32, copy=False)
+                arrays.append((name, np.ascontiguousarray(value)))
+            elif isinstance(value, dict):
+                target[key] = {}
+                walk(value, f"{name}.", target[key])
+            else:
+                target[key] = value
+
+    walk(payload, '', meta)
+    return arrays, meta
+
+
+def npy_response(payload: dict):
+    """
+    Encode a dict containing numpy arrays as a binary response.
+
+    Layout: a 4-byte little-endian manifest length, a JSON manifest, then
+    each array saved with np.save. The manifest lists every array's dotted
+    name, byte offset/length into the array section, shape and dtype; all
+    non-array values are carried in its 'meta' object. Float grids are sent
+    as float32.
+    """
+    arrays, meta = _split_arrays(payload)
+
+    body = io.BytesIO()
+    entries = []
+    for name, array in arrays:
+        offset = body.tell()
+        np.save(body, array, allow_pickle=False)
+        entries.append({
+            'name': name,
+            'offset': offset,
+            'length': body.tell() - offset,
+            'shape': list(array.shape),
+            'dtype': array.dtype.str
+        })
+
+    manifest = json.dumps({'arrays': entries, 'meta': meta}).encode()
+    return app.response_class(
+        struct.pack('<I', len(manifest)) + manifest + body.getvalue(),
+        mimetype='application/octet-stream'
+    )
+
+
+def arrow_response(payload: dict):
+    """
+    Encode a dict containing numpy arrays as an Arrow IPC stream.
+
+    The stream holds a single one-row record batch with one list column
+    per array (flattened, dotted names as in npy_response). Array shapes
+    and the non-array values are stored as JSON in the schema metadata
+    under b'shapes' and b'meta'.
+    """
+    arrays, meta = _split_arrays(payload)
+
+    columns = {
+        name: pa.array([array.ravel()], type=pa.list_(pa.from_numpy_dtype(array.dtype)))
+        for name, array in arrays
+    }
+    shapes = {name: list(array.shape) for name, array in arrays}
+    table = pa.table(columns).replace_schema_metadata({
+        'shapes': json.dumps(shapes),
+        'meta': json.dumps(meta)
+    })
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return app.response_class(sink.getvalue().to_pybytes(), mimetype=ARROW_STREAM_MIMETYPE)
+
+
+def binary_format():
+    """
+    Binary encoding requested by the client: 'npy', 'arrow' or None.
+
+    Chosen by ?format=npy|arrow, or by an Accept header preferring
+    application/octet-stream or the Arrow stream type.
+    """
+    requested = request.args.get('format')
+    if requested in ('npy', 'arrow'):
+        return requested
+    best = request.accept_mimetypes.best
+    if best == 'application/octet-stream':
+        return 'npy'
+    if best == ARROW_STREAM_MIMETYPE:
+        return 'arrow'
+    return None
+
+
+def binary_response(payload: dict, encoding: str):
+    """Encode payload with npy_response or arrow_response"""
+    if encoding == 'arrow':
+        return arrow_response(payload)
+    return npy_response(payload)
+
 
 # Configure CORS for domain hosting
 # ALLOWED_ORIGINS can be comma-separated list of origins
 # Example: https://szas.example.com,https://www.szas.example.com
 allowed_origins = os.environ.get('ALLOWED_ORIGINS', '*')
 if allowed_origins and allowed_origins != '*':
-    origins = [origin.strip() for origin in allowed_origins.split(',')]
-    logger.info(f"CORS configured for origins: {origins}")
+    origins = frozenset(origin.strip() for origin in allowed_origins.split(',') if origin.strip())
+    logger.info(f"CORS configured for origins: {sorted(origins)}")
+    CORS(app, origins=origins, supports_credentials=True)
 else:
-    origins = "*"
+    # Credentials cannot be combined with a wildcard origin, so skip them
+    # (and the per-request origin echo they require) in development mode
     logger.info("CORS configured for all origins (development mode)")
-
-CORS(app, origins=origins, supports_credentials=True)
+    CORS(app, origins="*", send_wildcard=True, supports_credentials=False)
 
 # Initialize components
 calculator = SZASCalculator()
@@ -43,18 +254,448 @@ PRELOAD_DATA = os.environ.get('PRELOAD_DATA', 'true').lower() == 'true'
 DEFAULT_YEAR = int(os.environ.get('DEFAULT_YEAR', 2025))
 
 
-@app.before_request
-def initialize_data():
-    """Initialize data on first request if not preloaded"""
-    if not hasattr(app, '_data_initialized'):
-        app._data_initialized = True
-        if PRELOAD_DATA:
-            logger.info(f"Pre-loading {DEFAULT_YEAR} Statcast data...")
-            try:
-                data_loader.get_data(year=DEFAULT_YEAR)
-                logger.info("Data pre-loaded successfully")
-            except Exception as e:
-                logger.warning(f"Could not pre-load data: {e}")
+# =============================================================================
+# Request body parsing
+# =============================================================================
+
+def _optional_int(value, name: str):
+    """Coerce an optional JSON id to int (None/'' mean 'not set')"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be an integer")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an integer")
+
+
+class JSONBody:
+    """
+    Base for typed POST bodies.
+
+    from_request() decodes the raw body once (with orjson when available),
+    keeps only the declared fields and lets __post_init__ coerce them, so
+    handlers get validated attributes instead of repeated dict lookups.
+    Raises ValueError for malformed bodies or values.
+    """
+
+    @classmethod
+    def from_request(cls):
+        raw = request.get_data(cache=False)
+        body = (orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)) if raw.strip() else {}
+        if body is None:
+            body = {}
+        if not isinstance(body, dict):
+            raise ValueError("Request body must be a JSON object")
+        return cls(**{k: v for k, v in body.items() if k in cls.__dataclass_fields__})
+
+
+@dataclass
+class FilterRequest(JSONBody):
+    """Body of /api/szas/calculate and /api/szas/zones"""
+    batter_id: Optional[int] = None
+    umpire_id: Optional[int] = None
+    year: int = DEFAULT_YEAR
+    bat_side: Optional[str] = None
+
+    def __post_init__(self):
+        self.batter_id = _optional_int(self.batter_id, 'batter_id')
+        self.umpire_id = _optional_int(self.umpire_id, 'umpire_id')
+        self.year = _optional_int(self.year, 'year') or DEFAULT_YEAR
+        self.bat_side = self.bat_side or None
+
+
+@dataclass
+class DownloadRequest(JSONBody):
+    """Body of /api/data/download"""
+    year: int = DEFAULT_YEAR
+    force: bool = False
+
+    def __post_init__(self):
+        self.year = _optional_int(self.year, 'year') or DEFAULT_YEAR
+        self.force = bool(self.force)
+
+
+def invalid_request(e: ValueError):
+    """400 response for a body rejected by JSONBody.from_request"""
+    return jsonify({'error': 'Invalid request', 'message': str(e)}), 400
+
+
+# =============================================================================
+# Memoized per-year aggregations
+#
+# These are pure functions of the season's cached data, so they are memoized
+# per version of the season file (see DataLoader.season_version): a season
+# re-downloaded by any worker is picked up by every worker. Callers must treat
+# the returned objects as read-only. Failed (None or empty) results are not
+# cached, so they are retried on the next request.
+# =============================================================================
+
+SEASON_CACHE_SIZE = 64
+
+# Set while a memoized call runs when a nested memoized call returned an
+# empty result, so the outer result is not cached either
+_season_cache_state = threading.local()
+
+
+def _is_empty_result(result) -> bool:
+    """Whether a memoized aggregation failed or found no data"""
+    if result is None:
+        return True
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.empty
+    if isinstance(result, dict):
+        return not result or result.get('data_source') == 'none'
+    if isinstance(result, (list, tuple)):
+        return len(result) == 0
+    return False
+
+
+def _season_cached(func):
+    """
+    Memoize func(..., year) on its arguments and the season file's version.
+
+    The year must be the last positional argument. Like lru_cache, the
+    wrapper has a cache_clear() method.
+    """
+    cache = OrderedDict()
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(*args):
+        key = (args, data_loader.season_version(args[-1]))
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        outer_empty = getattr(_season_cache_state, 'empty', False)
+        _season_cache_state.empty = False
+        try:
+            result = func(*args)
+            empty = _season_cache_state.empty or _is_empty_result(result)
+        finally:
+            _season_cache_state.empty = outer_empty
+        if empty:
+            _season_cache_state.empty = True
+            return result
+
+        with lock:
+            cache[key] = result
+            cache.move_to_end(key)
+            while len(cache) > SEASON_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+@_season_cached
+def _batters_for_year(year: int) -> pd.DataFrame:
+    """Position player list for a season (see DataLoader.get_available_batters)"""
+    return data_loader.get_available_batters(year=year)
+
+
+@_season_cached
+def _umpires_for_year(year: int) -> list:
+    """Top 100 home plate umpires for a season, most active first"""
+    pitch_data = data_loader.get_data(year=year, columns=['umpire_id', 'umpire_name'])
+
+    if pitch_data is None:
+        return []
+
+    if 'umpire_id' not in pitch_data.columns or 'umpire_name' not in pitch_data.columns:
+        logger.warning("Umpire data not available in pitch data")
+        return []
+
+    # Filter out placeholder/unknown umpires before counting so the hash is smaller
+    known = (
+        (pitch_data['umpire_id'] != 0)
+        & pitch_data['umpire_name'].notna()
+        & (pitch_data['umpire_name'] != 'Unknown')
+    )
+
+    # Count pitches per umpire (value_counts sorts most active first)
+    umpires = (
+        pitch_data.loc[known, ['umpire_id', 'umpire_name']]
+        .value_counts()
+        .rename('pitch_count')
+        .reset_index()
+        .rename(columns={'umpire_name': 'name'})
+    )
+
+    # Categorical names can yield unobserved zero-count pairs
+    umpires = umpires[umpires['pitch_count'] > 0]
+
+    # Return top 100 umpires
+    umpires = umpires.head(100)
+
+    return umpires.to_dict(orient='records')
+
+
+@_season_cached
+def _batter_info_table(year: int):
+    """Per-batter name, batting sides and pitch counts for a season, keyed by batter_id"""
+    pitch_data = data_loader.get_data(year=year, columns=['batter', 'stand', 'player_name'])
+
+    if pitch_data is None:
+        return None
+
+    # Pitch counts per (batter, side) in one pass: histogram a combined
+    # batter/side-code key rather than building a groupby
+    stand = pitch_data['stand'].astype('category')
+    sides = stand.cat.categories
+    codes = stand.cat.codes.to_numpy()
+    valid = codes >= 0
+    width = max(len(sides), 1)
+    keys, key_counts = np.unique(
+        pitch_data['batter'].to_numpy(dtype=np.int64)[valid] * width + codes[valid],
+        return_counts=True
+    )
+    side_counts = zip(zip(keys // width, sides[keys % width]), key_counts)
+
+    if 'player_name' in pitch_data.columns:
+        names = pitch_data.groupby('batter')['player_name'].first().to_dict()
+    else:
+        names = {}
+
+    table = {}
+    for (batter_id, side), count in side_counts:
+        batter_id = int(batter_id)
+        info = table.get(batter_id)
+        if info is None:
+            info = table[batter_id] = {
+                'batter_id': batter_id,
+                'name': names.get(batter_id, 'Unknown'),
+                'bat_sides': [],
+                'is_switch_hitter': False,
+                'pitch_count': 0,
+                'pitches_by_side': {}
+            }
+        info['bat_sides'].append(side)
+        info['pitch_count'] += int(count)
+        info['pitches_by_side'][side] = int(count)
+
+    for info in table.values():
+        info['bat_sides'].sort()
+        info['is_switch_hitter'] = len(info['bat_sides']) > 1
+
+    return table
+
+
+@_season_cached
+def _pitch_count_cube(year: int):
+    """Pitch counts per (batter, umpire_id, stand) cell for a season"""
+    pitch_data = data_loader.get_data(year=year, columns=['batter', 'umpire_id', 'stand'])
+
+    if pitch_data is None:
+        return None
+
+    keys = [c for c in ('batter', 'umpire_id', 'stand') if c in pitch_data.columns]
+    return pitch_data.groupby(keys, observed=True, dropna=False).size()
+
+
+@_season_cached
+def _pitch_count_arrays(year: int):
+    """
+    The counts cube flattened to int arrays for _count_matching.
+
+    Returns (batter, umpire_id, stand_codes, counts, side_codes, has_umpire)
+    or None. Missing umpire ids are stored as -2 so they only match 'any
+    umpire'; has_umpire is False when the season has no umpire_id column.
+    """
+    counts = _pitch_count_cube(year)
+    if counts is None:
+        return None
+
+    index = counts.index.to_frame(index=False)
+    n = len(index)
+    has_umpire = 'umpire_id' in index.columns
+    if has_umpire:
+        umpire = index['umpire_id'].fillna(-2).to_numpy(dtype=np.int64)
+    else:
+        umpire = np.full(n, -2, dtype=np.int64)
+    stand_codes, sides = pd.factorize(index['stand'].astype(str))
+    return (
+        index['batter'].to_numpy(dtype=np.int64),
+        umpire,
+        stand_codes.astype(np.int64),
+        counts.to_numpy(dtype=np.int64),
+        {side: code for code, side in enumerate(sides)},
+        has_umpire
+    )
+
+
+@_season_cached
+def _summary_for_year(year: int) -> dict:
+    """Summary statistics for a season (see DataLoader.get_data_summary)"""
+    return data_loader.get_data_summary(year=year)
+
+
+@_season_cached
+def _encoded_body(kind: str, year: int) -> tuple:
+    """Pre-encoded JSON body and its ETag for a per-year list/summary endpoint"""
+    if kind == 'batters':
+        # Top 100 batters by pitch count, encoded column-wise by pandas'
+        # C encoder instead of building a list of per-row dicts first
+        body = _batters_for_year(year).head(100).to_json(
+            orient='records', force_ascii=False
+        ).encode()
+        return body, hashlib.sha1(body).hexdigest()
+    elif kind == 'batters.arrow':
+        # Same rows as an Arrow IPC stream
+        table = pa.Table.from_pandas(_batters_for_year(year).head(100), preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        body = sink.getvalue().to_pybytes()
+        return body, hashlib.sha1(body).hexdigest()
+    elif kind == 'umpires':
+        payload = _umpires_for_year(year)
+    else:
+        payload = _summary_for_year(year)
+
+    body = app.json.dumps_bytes(payload)
+    return body, hashlib.sha1(body).hexdigest()
+
+
+def _cached_json_response(kind: str, year: int, mimetype: str = 'application/json'):
+    """Serve a pre-encoded body (see _encoded_body) without re-serializing"""
+    body, etag = _encoded_body(kind, year)
+    response = app.response_class(body, mimetype=mimetype)
+    response.set_etag(etag)
+    return response
+
+
+def _clear_year_caches():
+    """
+    Drop memoized aggregations after a season is re-downloaded
+
+    Not strictly needed, since a rewritten season file has a new version,
+    but it frees the entries for the old one right away.
+    """
+    _encoded_body.cache_clear()
+    _batters_for_year.cache_clear()
+    _umpires_for_year.cache_clear()
+    _batter_info_table.cache_clear()
+    _pitch_count_cube.cache_clear()
+    _pitch_count_arrays.cache_clear()
+    _summary_for_year.cache_clear()
+    # Its fingerprint key misses changes to locations, calls or umpires
+    bayesian_calculator.clear_cache()
+
+
+def preload_data():
+    """Load the default season into memory (runs on a background thread)"""
+    logger.info(f"Pre-loading {DEFAULT_YEAR} Statcast data...")
+    try:
+        data_loader.get_data(year=DEFAULT_YEAR)
+        logger.info("Data pre-loaded successfully")
+    except Exception as e:
+        logger.warning(f"Could not pre-load data: {e}")
+
+
+# Start preloading at import so no request has to wait for it to begin;
+# requests that arrive mid-load share the in-flight load. Under the Flask
+# debug reloader only the serving child process preloads.
+_reloader_parent = (
+    os.environ.get('FLASK_DEBUG', 'false').lower() == 'true'
+    and os.environ.get('WERKZEUG_RUN_MAIN') != 'true'
+)
+if PRELOAD_DATA and not _reloader_parent:
+    threading.Thread(target=preload_data, name='szas-preload', daemon=True).start()
+
+
+# GET endpoints whose bodies only change when a season is re-downloaded
+CACHEABLE_ENDPOINTS = {
+    'get_available_years', 'get_batters', 'get_batter_info', 'get_umpires',
+    'get_data_summary', 'get_sufficient_combos', 'bayesian_get_batters'
+}
+
+# Responses smaller than this are not worth compressing
+COMPRESS_MIN_SIZE = 512
+COMPRESS_MIMETYPES = {'application/json', 'application/octet-stream', ARROW_STREAM_MIMETYPE}
+
+
+def _zstd(data: bytes) -> bytes:
+    return pa.Codec('zstd', compression_level=3).compress(data, asbytes=True)
+
+
+def _brotli(data: bytes) -> bytes:
+    return pa.Codec('brotli', compression_level=5).compress(data, asbytes=True)
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=6)
+
+
+# Content-Encodings in order of preference. zstd and brotli come from the
+# codecs bundled with pyarrow, so they need no extra dependency.
+RESPONSE_ENCODINGS = [
+    (name, compress)
+    for name, codec, compress in (
+        ('zstd', 'zstd', _zstd),
+        ('br', 'brotli', _brotli),
+        ('gzip', None, _gzip)
+    )
+    if codec is None or pa.Codec.is_available(codec)
+]
+
+
+def response_encoding():
+    """Best Content-Encoding the client accepts, as (name, compress) or None"""
+    accepted = request.accept_encodings
+    for name, compress in RESPONSE_ENCODINGS:
+        if accepted[name]:
+            return name, compress
+    return None
+
+
+@app.after_request
+def finalize_response(response):
+    """Add ETag/Cache-Control to cacheable GETs and compress large bodies"""
+    if response.status_code != 200 or response.is_streamed:
+        return response
+
+    if request.method == 'GET' and request.endpoint in CACHEABLE_ENDPOINTS:
+        # Pre-encoded bodies already carry an ETag; hash the rest
+        response.add_etag(overwrite=False)
+        # Clients may store the body but must revalidate it on every use:
+        # a season can be re-downloaded at any time, and a matching ETag
+        # still costs only a 304
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        # Turns the response into a bodiless 304 when If-None-Match matches
+        response.make_conditional(request)
+        if response.status_code != 200:
+            return response
+
+    encoding = None
+    if (
+        response.mimetype in COMPRESS_MIMETYPES
+        and 'Content-Encoding' not in response.headers
+        and response.content_length is not None
+        and response.content_length >= COMPRESS_MIN_SIZE
+    ):
+        encoding = response_encoding()
+
+    if encoding is not None:
+        name, compress = encoding
+        response.set_data(compress(response.get_data()))
+        response.headers['Content-Encoding'] = name
+        response.vary.add('Accept-Encoding')
+        # The encoded body differs byte-wise, so only a weak validator holds
+        etag, _ = response.get_etag()
+        if etag:
+            response.set_etag(etag, weak=True)
+
+    return response
 
 
 @app.route('/api/health', methods=['GET'])
@@ -82,30 +723,23 @@ def calculate_szas():
     }
     """
     try:
-        data = request.get_json() or {}
+        req = FilterRequest.from_request()
+    except ValueError as e:
+        return invalid_request(e)
 
-        batter_id = data.get('batter_id')
-        umpire_id = data.get('umpire_id')
-        year = data.get('year', DEFAULT_YEAR)
-        bat_side = data.get('bat_side')
+    try:
+        batter_id, umpire_id, year, bat_side = req.batter_id, req.umpire_id, req.year, req.bat_side
 
-        # Load REAL pitch data from Statcast
-        pitch_data = data_loader.get_data(year=year, batter_id=batter_id)
+        # Load REAL pitch data from Statcast, filtered inside the loader
+        pitch_data = data_loader.get_data(year=year, batter_id=batter_id,
+                                          umpire_id=umpire_id, bat_side=bat_side)
 
-        if pitch_data is None or len(pitch_data) == 0:
+        if pitch_data is None:
             return jsonify({
                 'error': 'No data available',
                 'message': f'Could not load Statcast data for {year}',
             }), 500
 
-        # Filter data
-        if batter_id:
-            pitch_data = pitch_data[pitch_data['batter'] == batter_id]
-        if umpire_id and 'umpire_id' in pitch_data.columns:
-            pitch_data = pitch_data[pitch_data['umpire_id'] == umpire_id]
-        if bat_side:
-            pitch_data = pitch_data[pitch_data['stand'] == bat_side]
-
         if len(pitch_data) < 50:
             return jsonify({
                 'error': 'Insufficient data',
@@ -133,18 +767,21 @@ def get_zone_data():
     """
     Get zone probability surfaces for visualization using REAL data.
 
-    Returns probability grids for each zone type.
+    Returns probability grids for each zone type. Pass ?format=npy or
+    ?format=arrow (or the matching Accept type) for a binary response, see
+    npy_response / arrow_response.
     """
     try:
-        data = request.get_json() or {}
+        req = FilterRequest.from_request()
+    except ValueError as e:
+        return invalid_request(e)
 
-        batter_id = data.get('batter_id')
-        umpire_id = data.get('umpire_id')
-        year = data.get('year', DEFAULT_YEAR)
-        bat_side = data.get('bat_side')
+    try:
+        batter_id, umpire_id, year, bat_side = req.batter_id, req.umpire_id, req.year, req.bat_side
 
-        # Load REAL data
-        pitch_data = data_loader.get_data(year=year, batter_id=batter_id)
+        # Load REAL data, filtered inside the loader
+        pitch_data = data_loader.get_data(year=year, batter_id=batter_id,
+                                          umpire_id=umpire_id, bat_side=bat_side)
 
         if pitch_data is None or len(pitch_data) == 0:
             return jsonify({
@@ -152,17 +789,12 @@ def get_zone_data():
                 'message': f'Could not load Statcast data for {year}'
             }), 500
 
-        # Filter data
-        if batter_id:
-            pitch_data = pitch_data[pitch_data['batter'] == batter_id]
-        if umpire_id and 'umpire_id' in pitch_data.columns:
-            pitch_data = pitch_data[pitch_data['umpire_id'] == umpire_id]
-        if bat_side:
-            pitch_data = pitch_data[pitch_data['stand'] == bat_side]
-
         # Get zone surfaces
         zones = calculator.get_zone_surfaces(pitch_data)
 
+        encoding = binary_format()
+        if encoding:
+            return binary_response(zones, encoding)
         return jsonify(zones)
 
     except Exception as e:
@@ -178,12 +810,9 @@ def get_batters():
     """Get list of available batters from REAL Statcast data"""
     try:
         year = request.args.get('year', DEFAULT_YEAR, type=int)
-        batters = data_loader.get_available_batters(year=year)
-
-        # Return top 100 batters by pitch count
-        batters = batters.head(100)
-
-        return jsonify(batters.to_dict(orient='records'))
+        if binary_format() == 'arrow':
+            return _cached_json_response('batters.arrow', year, mimetype=ARROW_STREAM_MIMETYPE)
+        return _cached_json_response('batters', year)
     except Exception as e:
         logger.error(f"Error getting batters: {e}")
         return jsonify({'error': str(e)}), 500
@@ -194,35 +823,17 @@ def get_batter_info(batter_id):
     """Get detailed info about a specific batter including their batting sides"""
     try:
         year = request.args.get('year', DEFAULT_YEAR, type=int)
-        pitch_data = data_loader.get_data(year=year)
+        batter_table = _batter_info_table(year)
 
-        if pitch_data is None:
+        if batter_table is None:
             return jsonify({'error': 'No data available'}), 404
 
-        # Filter to this batter
-        batter_data = pitch_data[pitch_data['batter'] == batter_id]
+        info = batter_table.get(batter_id)
 
-        if len(batter_data) == 0:
+        if info is None:
             return jsonify({'error': 'Batter not found'}), 404
 
-        # Get batting sides this batter uses
-        bat_sides = batter_data['stand'].unique().tolist()
-        is_switch_hitter = len(bat_sides) > 1
-
-        # Get batter name
-        name = batter_data['player_name'].iloc[0] if 'player_name' in batter_data.columns else 'Unknown'
-
-        # Get pitch counts per side
-        side_counts = batter_data.groupby('stand').size().to_dict()
-
-        return jsonify({
-            'batter_id': batter_id,
-            'name': name,
-            'bat_sides': sorted(bat_sides),
-            'is_switch_hitter': is_switch_hitter,
-            'pitch_count': len(batter_data),
-            'pitches_by_side': side_counts
-        })
+        return jsonify(info)
 
     except Exception as e:
         logger.error(f"Error getting batter info: {e}")
@@ -234,34 +845,8 @@ def get_umpires():
     """Get list of available home plate umpires with their pitch counts"""
     try:
         year = request.args.get('year', DEFAULT_YEAR, type=int)
-        pitch_data = data_loader.get_data(year=year)
-
-        if pitch_data is None:
-            return jsonify([])
-
-        if 'umpire_id' not in pitch_data.columns or 'umpire_name' not in pitch_data.columns:
-            logger.warning("Umpire data not available in pitch data")
-            return jsonify([])
-
-        # Group by umpire and get counts with names
-        umpires = pitch_data.groupby(['umpire_id', 'umpire_name']).agg({
-            'plate_x': 'count'
-        }).reset_index()
-        umpires.columns = ['umpire_id', 'name', 'pitch_count']
-
-        # Filter out placeholder/unknown umpires
-        umpires = umpires[umpires['umpire_id'] != 0]
-        umpires = umpires[umpires['name'] != 'Unknown']
-        umpires = umpires[umpires['name'].notna()]
-
-        # Sort by pitch count (most active umpires first)
-        umpires = umpires.sort_values('pitch_count', ascending=False)
-
-        # Return top 100 umpires
-        umpires = umpires.head(100)
-
-        logger.info(f"Returning {len(umpires)} umpires")
-        return jsonify(umpires.to_dict(orient='records'))
+        logger.info(f"Returning {len(_umpires_for_year(year))} umpires")
+        return _cached_json_response('umpires', year)
 
     except Exception as e:
         logger.error(f"Error getting umpires: {e}")
@@ -273,8 +858,7 @@ def get_data_summary():
     """Get summary statistics of available REAL data"""
     try:
         year = request.args.get('year', DEFAULT_YEAR, type=int)
-        summary = data_loader.get_data_summary(year=year)
-        return jsonify(summary)
+        return _cached_json_response('summary', year)
     except Exception as e:
         logger.error(f"Error getting summary: {e}")
         return jsonify({'error': str(e)}), 500
@@ -292,24 +876,25 @@ def get_pitch_count():
         umpire_id = request.args.get('umpire_id', type=int)
         bat_side = request.args.get('bat_side')
 
-        pitch_data = data_loader.get_data(year=year, batter_id=batter_id)
+        cube = _pitch_count_arrays(year)
 
-        if pitch_data is None or len(pitch_data) == 0:
+        if cube is None or len(cube[3]) == 0:
             return jsonify({
                 'pitch_count': 0,
                 'sufficient': False,
                 'minimum_required': 50
             })
 
-        # Apply filters
-        if batter_id:
-            pitch_data = pitch_data[pitch_data['batter'] == batter_id]
-        if umpire_id and 'umpire_id' in pitch_data.columns:
-            pitch_data = pitch_data[pitch_data['umpire_id'] == umpire_id]
-        if bat_side:
-            pitch_data = pitch_data[pitch_data['stand'] == bat_side]
-
-        count = len(pitch_data)
+        # Sum the matching (batter, umpire, side) cells instead of filtering pitches
+        batters, umpires, stands, cell_counts, side_codes, has_umpire = cube
+        side_code = side_codes.get(bat_side, -2) if bat_side else -1
+        # Without umpire data the umpire filter is skipped, as calculate_szas does
+        if not has_umpire:
+            umpire_id = None
+        count = 0 if side_code == -2 else int(_count_matching(
+            batters, umpires, stands, cell_counts,
+            batter_id or -1, umpire_id or -1, side_code
+        ))
         return jsonify({
             'pitch_count': count,
             'sufficient': count >= 50,
@@ -321,6 +906,55 @@ def get_pitch_count():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/data/sufficient-combos', methods=['GET'])
+def get_sufficient_combos():
+    """
+    Get every (batter, umpire, bat side) combination with enough pitches
+    for an SZAS calculation, so clients can grey out the rest without
+    calling /api/data/pitch-count per selection.
+
+    Pass ?format=npy or ?format=arrow for packed int32 id columns.
+    """
+    try:
+        year = request.args.get('year', DEFAULT_YEAR, type=int)
+        min_pitches = request.args.get('min_pitches', 50, type=int)
+
+        counts = _pitch_count_cube(year)
+
+        if counts is None or len(counts) == 0:
+            cells = pd.DataFrame(columns=['batter', 'umpire_id', 'stand', 'pitch_count'])
+        else:
+            cells = counts[counts >= min_pitches].reset_index(name='pitch_count')
+            if 'umpire_id' not in cells.columns:
+                cells['umpire_id'] = 0
+            # Placeholder (0) and missing umpires are not selectable
+            cells = cells[cells['umpire_id'].notna() & (cells['umpire_id'] != 0)]
+
+        combos = {
+            'batter_id': cells['batter'].to_numpy(dtype=np.int32),
+            'umpire_id': cells['umpire_id'].to_numpy(dtype=np.int32),
+            'bat_side': cells['stand'].astype(str).to_numpy(dtype='<U1'),
+            'pitch_count': cells['pitch_count'].to_numpy(dtype=np.int32)
+        }
+
+        encoding = binary_format()
+        if encoding:
+            return binary_response({'year': year, 'minimum_required': min_pitches, **combos}, encoding)
+
+        return jsonify({
+            'year': year,
+            'minimum_required': min_pitches,
+            'combos': [
+                [int(b), int(u), side, int(n)]
+                for b, u, side, n in zip(*combos.values())
+            ]
+        })
+
+    except Exception as e:
+        logger.error(f"Error getting sufficient combos: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/data/download', methods=['POST'])
 def download_data():
     """
@@ -333,14 +967,19 @@ def download_data():
     }
     """
     try:
-        data = request.get_json() or {}
-        year = data.get('year', DEFAULT_YEAR)
-        force = data.get('force', False)
+        req = DownloadRequest.from_request()
+    except ValueError as e:
+        return invalid_request(e)
+
+    try:
+        year, force = req.year, req.force
 
         logger.info(f"Downloading data for {year} (force={force})")
         success = data_loader.download_season_data(year=year, force=force)
 
         if success:
+            data_loader.clear_cache(year)
+            _clear_year_caches()
             return jsonify({
                 'status': 'success',
                 'message': f'Data for {year} downloaded and cached',
@@ -357,20 +996,26 @@ def download_data():
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/data/years', methods=['GET'])
-def get_available_years():
-    """Get list of years with available Statcast data"""
+@lru_cache(maxsize=1)
+def _years_response_body(current_year: int) -> bytes:
+    """Encoded /api/data/years payload; keyed by year so it rolls over on Jan 1"""
     # Statcast data is available from 2015-present
-    current_year = pd.Timestamp.now().year
     years = list(range(2015, current_year + 1))
 
-    return jsonify({
+    return app.json.dumps_bytes({
         'years': years,
         'default': DEFAULT_YEAR,
         'note': 'Statcast data available from 2015-present'
     })
 
 
+@app.route('/api/data/years', methods=['GET'])
+def get_available_years():
+    """Get list of years with available Statcast data"""
+    body = _years_response_body(date.today().year)
+    return app.response_class(body, mimetype='application/json')
+
+
 # =============================================================================
 # Bayesian Umpire Influence Analysis Endpoints
 # =============================================================================
@@ -427,9 +1072,7 @@ def bayesian_analyze():
         return jsonify(result)
 
     except Exception as e:
-        logger.error(f"Bayesian analysis error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Bayesian analysis error: {e}")
         return jsonify({
             'error': 'Analysis error',
             'message': str(e)
@@ -448,9 +1091,9 @@ def bayesian_analyze_single(batter_id):
     try:
         year = request.args.get('year', DEFAULT_YEAR, type=int)
 
-        pitch_data = data_loader.get_data(year=year)
+        pitch_data = data_loader.get_batter_slice(year, batter_id)
 
-        if pitch_data is None or len(pitch_data) == 0:
+        if pitch_data is None:
             return jsonify({
                 'error': 'No data available',
                 'message': f'Could not load Statcast data for {year}'
@@ -486,7 +1129,7 @@ def bayesian_get_batters():
         year = request.args.get('year', DEFAULT_YEAR, type=int)
         min_long_abs = request.args.get('min_long_abs', 10, type=int)
 
-        pitch_data = data_loader.get_data(year=year)
+        pitch_data = data_loader.get_data(year=year, columns=['batter', 'game_pk', 'at_bat_number'])
 
         if pitch_data is None or len(pitch_data) == 0:
             return jsonify([])
@@ -503,7 +1146,7 @@ def bayesian_get_batters():
         )
 
         # Merge with batter names from main batter list
-        all_batters = data_loader.get_available_batters(year=year)
+        all_batters = _batters_for_year(year)
         if 'name' in all_batters.columns:
             batters = batters.merge(
                 all_batters[['batter_id', 'name']],
@@ -20,11 +20,15 @@ The Bayesian approach:
 
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
 from scipy.stats import chi2_contingency
+from scipy.optimize import minimize
+from scipy.special import expit
+import os
+import threading
 import warnings
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 
 try:
     from pybaseball import playerid_reverse_lookup
@@ -32,6 +36,20 @@ try:
 except ImportError:
     PYBASEBALL_AVAILABLE = False
 
+# joblib fans batters out across processes
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+# Try to import numba for the compiled prior swing rate kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
@@ -39,6 +57,94 @@ logger = logging.getLogger(__name__)
 _player_name_cache = {}
 
 
+@lru_cache(maxsize=4096)
+def _lookup_batter_name(batter_id: int) -> str:
+    """
+    Single-player pybaseball lookup, or None if the id is unknown.
+
+    Unknown ids are memoized so they are not looked up again; lookup
+    errors propagate (and so are not cached) for the caller to handle.
+    """
+    lookup = playerid_reverse_lookup([batter_id], key_type='mlbam')
+    if lookup.empty:
+        return None
+    first_name = str(lookup.iloc[0].get('name_first', '')).title()
+    last_name = str(lookup.iloc[0].get('name_last', '')).title()
+    if first_name and last_name:
+        return f"{first_name} {last_name}"
+    return None
+
+
+def _fit_logistic(X: np.ndarray, y: np.ndarray, C: float = 1.0, x0: np.ndarray = None,
+                  max_iter: int = 1000, tol: float = 1e-4) -> tuple:
+    """
+    L2-regularized logistic regression fitted directly with L-BFGS.
+
+    Minimizes the same objective as sklearn's LogisticRegression(C=C,
+    solver='lbfgs') - mean log-loss plus ||coef||^2 / (2*C*n), intercept
+    unpenalized - with the same stopping rules, but without the estimator's
+    per-fit validation overhead. x0 is [coef..., intercept].
+
+    Returns (coef, intercept).
+    """
+    classes = np.unique(y)
+    if len(classes) < 2:
+        raise ValueError(
+            "This solver needs samples of at least 2 classes in the data, "
+            f"but the data contains only one class: {classes[0]}"
+        )
+
+    n, n_features = X.shape
+    y = (y == classes[1]).astype(np.float64)
+    l2 = 1.0 / (C * n)
+
+    def loss_and_grad(w):
+        coef, intercept = w[:-1], w[-1]
+        z = X @ coef + intercept
+        loss = np.mean(np.logaddexp(0.0, z) - y * z) + 0.5 * l2 * (coef @ coef)
+        residual = (expit(z) - y) / n
+        grad = np.empty_like(w)
+        grad[:-1] = X.T @ residual + l2 * coef
+        grad[-1] = residual.sum()
+        return loss, grad
+
+    if x0 is None:
+        x0 = np.zeros(n_features + 1)
+    result = minimize(
+        loss_and_grad, x0, jac=True, method='L-BFGS-B',
+        options={'maxiter': max_iter, 'maxls': 50, 'gtol': tol,
+                 'ftol': 64 * np.finfo(float).eps}
+    )
+    return result.x[:-1], result.x[-1]
+
+
+def _prior_swing_kernel(ab_codes, is_swing):
+    """
+    Prior swing rate and 1-indexed pitch number for each pitch.
+
+    Expects rows grouped by at-bat (ab_codes contiguous); walks them once,
+    resetting the running counts whenever the at-bat code changes.
+    """
+    n = ab_codes.shape[0]
+    prior = np.empty(n)
+    pitch_in_ab = np.empty(n, dtype=np.int64)
+    count = 0
+    swings = 0
+    for i in range(n):
+        if i > 0 and ab_codes[i] != ab_codes[i - 1]:
+            count = 0
+            swings = 0
+        prior[i] = 0.5 if count == 0 else swings / count
+        pitch_in_ab[i] = count + 1
+        count += 1
+        swings += is_swing[i]
+    return prior, pitch_in_ab
+
+
+if NUMBA_AVAILABLE:
+    _prior_swing_kernel = njit(cache=True)(_prior_swing_kernel)
+
+
 class BayesianInfluenceCalculator:
     """
     Calculator for Bayesian analysis of umpire influence by batter swing behavior.
@@ -48,28 +154,63 @@ class BayesianInfluenceCalculator:
     MIN_AT_BAT_PITCHES = 4  # Only analyze at-bats with 4+ pitches
     MIN_TAKES_FOR_ANALYSIS = 20  # Need enough takes to model umpire behavior
 
-    def __init__(self):
-        self.scaler = StandardScaler()
+    # Below this many batters, worker start-up costs more than it saves
+    PARALLEL_MIN_BATTERS = 4
+
+    # Memoized analyze_batter results, keyed by a fingerprint of the slice
+    RESULT_CACHE_SIZE = 256
 
-    def analyze_batter(self, pitch_data: pd.DataFrame, batter_id: int) -> dict:
+    def __init__(self):
+        self._result_cache = OrderedDict()
+        self._result_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Worker processes get a fresh (empty) result cache and lock
+        state = self.__dict__.copy()
+        del state['_result_cache'], state['_result_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._result_cache = OrderedDict()
+        self._result_lock = threading.Lock()
+
+    def clear_cache(self):
+        """Drop memoized analyze_batter results (e.g. after a season is re-downloaded)"""
+        with self._result_lock:
+            self._result_cache.clear()
+
+    def analyze_batter(self, pitch_data: pd.DataFrame, batter_id: int,
+                       batter_name: str = None) -> dict:
         """
         Analyze a single batter for umpire influence patterns.
 
         Args:
             pitch_data: Full pitch data with at-bat tracking columns
             batter_id: MLB player ID to analyze
+            batter_name: Optional display name; looked up if not given
 
         Returns:
             Dictionary with influence analysis results
         """
-        # Filter to this batter
-        batter_data = pitch_data[pitch_data['batter'] == batter_id].copy()
+        # Filter to this batter (callers may pass a pre-sliced frame). The
+        # sort below makes the one private copy that columns are added to.
+        if (pitch_data['batter'] == batter_id).all():
+            batter_data = pitch_data
+        else:
+            batter_data = pitch_data[pitch_data['batter'] == batter_id]
 
         if len(batter_data) == 0:
             return {'error': 'No data for batter', 'batter_id': batter_id}
 
+        result_key = self._result_key(batter_data, batter_id)
+        cached = self._cached_result(result_key)
+        if cached is not None:
+            return cached
+
         # Get batter name
-        batter_name = self._get_batter_name(batter_data)
+        if batter_name is None:
+            batter_name = self._get_batter_name(batter_data)
 
         # Ensure we have required columns
         required_cols = ['at_bat_number', 'pitch_number', 'game_pk', 'plate_x', 'plate_z', 'description']
@@ -81,26 +222,44 @@ class BayesianInfluenceCalculator:
                 'batter_name': batter_name
             }
 
-        # Create at-bat identifier (game + at_bat_number)
-        batter_data['ab_id'] = batter_data['game_pk'].astype(str) + '_' + batter_data['at_bat_number'].astype(str)
-
-        # Sort by game, at-bat, and pitch number
-        batter_data = batter_data.sort_values(['game_pk', 'at_bat_number', 'pitch_number'])
-
-        # Classify pitches
-        batter_data = self._classify_pitches(batter_data)
-
-        # Filter to at-bats with 4+ pitches
-        ab_pitch_counts = batter_data.groupby('ab_id').size()
-        valid_abs = ab_pitch_counts[ab_pitch_counts >= self.MIN_AT_BAT_PITCHES].index
-        long_abs = batter_data[batter_data['ab_id'].isin(valid_abs)].copy()
+        # Create at-bat identifier (game + at_bat_number) as an int64 composite;
+        # no game has anywhere near 1000 plate appearances
+        ab_id = (
+            batter_data['game_pk'].to_numpy(dtype=np.int64) * np.int64(1000)
+            + batter_data['at_bat_number'].to_numpy(dtype=np.int64)
+        )
+
+        # Sort by game, at-bat, and pitch number - unless the caller already
+        # did (analyze_multiple_batters sorts all selected batters at once)
+        order = self._pitch_sequence(ab_id, batter_data['pitch_number'].to_numpy())
+        if np.all(order[1:] >= order[:-1]):
+            batter_data = batter_data.copy()
+        else:
+            order = np.argsort(order, kind='stable')
+            batter_data = batter_data.take(order)
+            ab_id = ab_id[order]
+        batter_data['ab_id'] = ab_id
+
+        # Classify pitches (unless the caller already did for all batters)
+        if 'is_take' not in batter_data.columns:
+            batter_data = self._classify_pitches(batter_data)
+
+        # Filter to at-bats with 4+ pitches. Rows are sorted, so each at-bat
+        # is a contiguous run of ab_id and its size is the run length - no
+        # groupby or hashing needed
+        run_starts = np.flatnonzero(np.r_[True, ab_id[1:] != ab_id[:-1]])
+        run_sizes = np.diff(np.r_[run_starts, len(ab_id)])
+        long_runs = run_sizes >= self.MIN_AT_BAT_PITCHES
+        total_at_bats = len(run_starts)
+        long_at_bats = int(long_runs.sum())
+        long_abs = batter_data[np.repeat(long_runs, run_sizes)]
 
         if len(long_abs) == 0:
             return {
                 'error': 'No at-bats with 4+ pitches',
                 'batter_id': batter_id,
                 'batter_name': batter_name,
-                'total_at_bats': batter_data['ab_id'].nunique(),
+                'total_at_bats': total_at_bats,
                 'total_pitches': len(batter_data)
             }
 
@@ -108,15 +267,15 @@ class BayesianInfluenceCalculator:
         long_abs = self._calculate_cumulative_swing_rate(long_abs)
 
         # Analyze influence on takes (where umpire makes decision)
-        takes = long_abs[long_abs['is_take'] == 1].copy()
+        takes = long_abs[long_abs['is_take'] == 1]
 
         if len(takes) < self.MIN_TAKES_FOR_ANALYSIS:
             return {
                 'error': f'Insufficient takes for analysis (need {self.MIN_TAKES_FOR_ANALYSIS}, have {len(takes)})',
                 'batter_id': batter_id,
                 'batter_name': batter_name,
-                'total_at_bats': long_abs['ab_id'].nunique(),
-                'long_at_bats': len(valid_abs),
+                'total_at_bats': long_at_bats,
+                'long_at_bats': long_at_bats,
                 'total_pitches': len(long_abs)
             }
 
@@ -129,7 +288,7 @@ class BayesianInfluenceCalculator:
         # Calculate overall batter stats
         batter_stats = self._calculate_batter_stats(batter_data, long_abs)
 
-        return {
+        result = {
             'batter_id': batter_id,
             'batter_name': batter_name,
             'influence_analysis': influence_result,
@@ -137,12 +296,14 @@ class BayesianInfluenceCalculator:
             'batter_stats': batter_stats,
             'data_summary': {
                 'total_pitches': len(batter_data),
-                'total_at_bats': batter_data['ab_id'].nunique(),
-                'long_at_bats': len(valid_abs),
+                'total_at_bats': total_at_bats,
+                'long_at_bats': long_at_bats,
                 'pitches_in_long_abs': len(long_abs),
                 'takes_analyzed': len(takes)
             }
         }
+        self._store_result(result_key, result)
+        return result
 
     def analyze_multiple_batters(self, pitch_data: pd.DataFrame,
                                   batter_ids: list = None,
@@ -163,11 +324,43 @@ class BayesianInfluenceCalculator:
             batter_counts = pitch_data.groupby('batter').size().sort_values(ascending=False)
             batter_ids = batter_counts.head(top_n).index.tolist()
 
-        results = []
+        # Sort and classify the selected batters' pitches in one pass each,
+        # then hand each batter its own (already ordered) slice
+        selected = pitch_data[pitch_data['batter'].isin(batter_ids)]
+        sort_columns = [c for c in ('batter', 'game_pk', 'at_bat_number', 'pitch_number')
+                        if c in selected.columns]
+        selected = selected.sort_values(sort_columns, kind='stable')
+        if 'description' in selected.columns:
+            selected = self._classify_pitches(selected)
+        batter_slices = dict(tuple(selected.groupby('batter', sort=False)))
+
+        # Names are resolved here, in one bulk lookup, so worker processes
+        # don't repeat them (and the results land in this process's cache)
+        self._prefetch_batter_names(batter_slices.keys())
+        jobs = []
         for batter_id in batter_ids:
-            logger.info(f"Analyzing batter {batter_id}...")
-            result = self.analyze_batter(pitch_data, batter_id)
-            results.append(result)
+            batter_data = batter_slices.get(batter_id, selected.iloc[:0])
+            batter_name = self._get_batter_name(batter_data) if len(batter_data) else None
+            jobs.append((batter_data, batter_id, batter_name))
+
+        # Serve memoized batters here; workers can't see this process's cache
+        results = [self._cached_result(self._result_key(job[0], job[1])) for job in jobs]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if JOBLIB_AVAILABLE and len(pending) >= self.PARALLEL_MIN_BATTERS:
+            n_jobs = min(len(pending), os.cpu_count() or 1)
+            logger.info(f"Analyzing {len(pending)} batters across {n_jobs} processes...")
+            computed = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(self.analyze_batter)(*jobs[i]) for i in pending
+            )
+            for i, result in zip(pending, computed):
+                if 'error' not in result:
+                    self._store_result(self._result_key(jobs[i][0], jobs[i][1]), result)
+                results[i] = result
+        else:
+            for i in pending:
+                logger.info(f"Analyzing batter {jobs[i][1]}...")
+                results[i] = self.analyze_batter(*jobs[i])
 
         # Aggregate findings
         successful = [r for r in results if 'error' not in r]
@@ -186,6 +379,46 @@ class BayesianInfluenceCalculator:
             }
         }
 
+    @staticmethod
+    def _pitch_sequence(ab_id: np.ndarray, pitch_number: np.ndarray) -> np.ndarray:
+        """Int64 key ordering pitches by at-bat, then pitch number"""
+        return ab_id * np.int64(1000) + pitch_number.astype(np.int64)
+
+    @staticmethod
+    def _result_key(batter_data: pd.DataFrame, batter_id: int):
+        """Cheap fingerprint of a batter's pitch slice, or None if it has none"""
+        if len(batter_data) == 0 or 'pitch_number' not in batter_data.columns \
+                or 'game_pk' not in batter_data.columns:
+            return None
+        return (
+            batter_id,
+            len(batter_data),
+            int(batter_data['pitch_number'].sum()),
+            int(batter_data['game_pk'].max())
+        )
+
+    def _cached_result(self, key) -> dict:
+        """Copy of a memoized analyze_batter result, or None"""
+        if key is None:
+            return None
+        with self._result_lock:
+            result = self._result_cache.get(key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(key)
+        # Callers add top-level keys (e.g. 'year') to the returned dict
+        return dict(result)
+
+    def _store_result(self, key, result: dict):
+        """Memoize an analyze_batter result, evicting the oldest entries"""
+        if key is None:
+            return
+        with self._result_lock:
+            self._result_cache[key] = dict(result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
     def _classify_pitches(self, data: pd.DataFrame) -> pd.DataFrame:
         """Classify pitches as takes, swings, strikes, balls."""
         take_descriptions = ['called_strike', 'ball', 'blocked_ball', 'pitchout']
@@ -193,10 +426,25 @@ class BayesianInfluenceCalculator:
                               'foul_tip', 'hit_into_play', 'hit_into_play_score',
                               'hit_into_play_no_out', 'foul_bunt', 'missed_bunt']
 
-        data['is_take'] = data['description'].isin(take_descriptions).astype(int)
-        data['is_swing'] = data['description'].isin(swing_descriptions).astype(int)
-        data['is_called_strike'] = (data['description'] == 'called_strike').astype(int)
-        data['is_ball'] = (data['description'] == 'ball').astype(int)
+        # Classify each distinct description once and broadcast by code;
+        # missing descriptions get code -1, i.e. the trailing None slot.
+        # The loader stores description as a categorical, so its codes are
+        # used directly instead of hashing every row's string
+        description = data['description']
+        if isinstance(description.dtype, pd.CategoricalDtype):
+            codes = description.cat.codes.to_numpy()
+            descriptions = description.cat.categories
+        else:
+            codes, descriptions = pd.factorize(description)
+        descriptions = list(descriptions) + [None]
+        labels = {
+            'is_take': [d in take_descriptions for d in descriptions],
+            'is_swing': [d in swing_descriptions for d in descriptions],
+            'is_called_strike': [d == 'called_strike' for d in descriptions],
+            'is_ball': [d == 'ball' for d in descriptions]
+        }
+        for column, flags in labels.items():
+            data[column] = np.array(flags, dtype=np.int8)[codes]
 
         return data
 
@@ -208,24 +456,37 @@ class BayesianInfluenceCalculator:
         This represents what the umpire has "learned" about the batter's
         swing tendencies from observing earlier pitches in the at-bat.
         """
-        # Sort to ensure proper order
-        data = data.sort_values(['ab_id', 'pitch_number']).copy()
-
-        # For each pitch, calculate swing rate from previous pitches in the AB
-        def calc_prior_swing_rate(group):
-            swings = group['is_swing'].values
-            # Cumulative sum of swings up to (not including) current pitch
-            cum_swings = np.concatenate([[0], np.cumsum(swings[:-1])])
-            # Number of pitches before current one
-            pitch_nums = np.arange(len(swings))
-            # Prior swing rate (0 for first pitch)
-            prior_rate = np.where(pitch_nums > 0, cum_swings / pitch_nums, 0.5)
-            return pd.Series(prior_rate, index=group.index)
-
-        data['prior_swing_rate'] = data.groupby('ab_id', group_keys=False).apply(calc_prior_swing_rate)
+        # Sort to ensure proper order (analyze_batter passes rows in order)
+        order = self._pitch_sequence(data['ab_id'].to_numpy(), data['pitch_number'].to_numpy())
+        if not np.all(order[1:] >= order[:-1]):
+            data = data.sort_values(['ab_id', 'pitch_number'])
+
+        if NUMBA_AVAILABLE:
+            # Single compiled pass over the at-bat-ordered rows
+            ab_codes, _ = pd.factorize(data['ab_id'])
+            prior, pitch_in_ab = _prior_swing_kernel(
+                ab_codes.astype(np.int64), data['is_swing'].to_numpy(dtype=np.int64)
+            )
+            data['prior_swing_rate'] = prior
+            data['pitch_in_ab'] = pitch_in_ab.astype(np.int16)
+            return data
+
+        # Swings and pitches seen earlier in the same at-bat, in one
+        # vectorized pass instead of a Python callback per at-bat
+        grouped = data.groupby('ab_id', sort=False)
+        swings = data['is_swing'].to_numpy()
+        pitches_before = grouped.cumcount().to_numpy()
+        swings_before = grouped['is_swing'].cumsum().to_numpy() - swings
+
+        # Prior swing rate (0.5 for the first pitch, with no history yet)
+        data['prior_swing_rate'] = np.where(
+            pitches_before > 0,
+            swings_before / np.maximum(pitches_before, 1),
+            0.5
+        )
 
         # Also track pitch number within at-bat (1-indexed)
-        data['pitch_in_ab'] = data.groupby('ab_id').cumcount() + 1
+        data['pitch_in_ab'] = (pitches_before + 1).astype(np.int16)
 
         return data
 
@@ -239,7 +500,7 @@ class BayesianInfluenceCalculator:
         If prior_swing_rate coefficient is significant, there may be influence.
         """
         # Only analyze takes where we have prior info (not first pitch)
-        analysis_data = takes[takes['pitch_in_ab'] > 1].copy()
+        analysis_data = takes[takes['pitch_in_ab'] > 1]
 
         if len(analysis_data) < 20:
             return {
@@ -247,31 +508,29 @@ class BayesianInfluenceCalculator:
                 'takes_analyzed': len(analysis_data)
             }
 
-        # Prepare features
-        # Model 1: Location only (baseline)
-        X_location = analysis_data[['plate_x', 'plate_z']].values
-
-        # Model 2: Location + prior swing rate
-        X_with_swing = np.column_stack([
-            X_location,
-            analysis_data['prior_swing_rate'].values
-        ])
+        # Prepare features as one contiguous matrix:
+        # location (baseline model) + prior swing rate (swing model)
+        X_with_swing = np.ascontiguousarray(
+            analysis_data[['plate_x', 'plate_z', 'prior_swing_rate']].to_numpy(dtype=np.float64)
+        )
+        X_location = X_with_swing[:, :2]
 
         y = analysis_data['is_called_strike'].values
 
         try:
-            # Fit baseline model (location only)
-            model_baseline = LogisticRegression(max_iter=1000, C=1.0)
-            model_baseline.fit(X_location, y)
-            baseline_score = model_baseline.score(X_location, y)
-
             # Fit model with swing rate
-            model_with_swing = LogisticRegression(max_iter=1000, C=1.0)
-            model_with_swing.fit(X_with_swing, y)
-            swing_score = model_with_swing.score(X_with_swing, y)
+            swing_coef_, swing_intercept = _fit_logistic(X_with_swing, y, C=1.0)
+            swing_score = self._training_accuracy(swing_coef_, swing_intercept, X_with_swing, y)
+
+            # Fit baseline model (location only), starting LBFGS from the
+            # swing model's location coefficients - it is usually close
+            baseline_coef, baseline_intercept = _fit_logistic(
+                X_location, y, C=1.0, x0=np.append(swing_coef_[:2], swing_intercept)
+            )
+            baseline_score = self._training_accuracy(baseline_coef, baseline_intercept, X_location, y)
 
             # Get coefficient for swing rate
-            swing_coef = model_with_swing.coef_[0][2]  # Third feature
+            swing_coef = swing_coef_[2]  # Third feature
 
             # Interpret the coefficient
             # Positive = higher swing rate -> more called strikes
@@ -302,34 +561,51 @@ class BayesianInfluenceCalculator:
                 'takes_analyzed': len(analysis_data)
             }
 
+    @staticmethod
+    def _training_accuracy(coef: np.ndarray, intercept: float, X: np.ndarray, y: np.ndarray) -> float:
+        """Accuracy on the training rows straight from the linear decision function"""
+        predicted = X @ coef + intercept > 0
+        return float(np.mean(predicted == (y == y.max())))
+
     def _analyze_by_zone(self, takes: pd.DataFrame) -> dict:
         """
         Analyze influence in different zones (inside, outside, high, low, heart).
         """
-        # Define zones
-        takes = takes.copy()
-
-        # Zone classification based on plate_x and plate_z
+        # Zone classification based on plate_x and plate_z, into local
+        # arrays so takes is neither copied nor modified
         # Assuming average sz_top ~3.5, sz_bot ~1.5
         sz_mid = (takes['sz_top'].mean() + takes['sz_bot'].mean()) / 2 if 'sz_top' in takes.columns else 2.5
 
-        takes['zone_type'] = 'heart'  # Default
-        takes.loc[takes['plate_x'] < -0.5, 'zone_type'] = 'inside_rhh'  # Inside to RHH
-        takes.loc[takes['plate_x'] > 0.5, 'zone_type'] = 'outside_rhh'  # Outside to RHH
-        takes.loc[takes['plate_z'] > sz_mid + 0.5, 'zone_type'] = 'high'
-        takes.loc[takes['plate_z'] < sz_mid - 0.5, 'zone_type'] = 'low'
-
-        # Edge zone (borderline pitches where influence matters most)
-        takes['is_edge'] = (
-            (abs(takes['plate_x']) > 0.6) & (abs(takes['plate_x']) < 1.0) |
-            (takes['plate_z'] > takes['sz_top'] - 0.3) & (takes['plate_z'] < takes['sz_top'] + 0.3) |
-            (takes['plate_z'] > takes['sz_bot'] - 0.3) & (takes['plate_z'] < takes['sz_bot'] + 0.3)
-        ).astype(int) if 'sz_top' in takes.columns else 0
+        # One np.select pass; earlier conditions win, so vertical zones take
+        # precedence over horizontal ones and 'heart' is the default
+        plate_x = takes['plate_x'].to_numpy()
+        plate_z = takes['plate_z'].to_numpy()
+        zone_type = np.select(
+            [
+                plate_z < sz_mid - 0.5,
+                plate_z > sz_mid + 0.5,
+                plate_x > 0.5,   # Outside to RHH
+                plate_x < -0.5   # Inside to RHH
+            ],
+            ['low', 'high', 'outside_rhh', 'inside_rhh'],
+            default='heart'
+        )
+
+        # Edge zone (borderline pitches where influence matters most):
+        # the horizontal edge band, or within 0.3 ft of the top/bottom
+        if 'sz_top' in takes.columns:
+            abs_x = np.abs(plate_x)
+            edge_x = (abs_x > 0.6) & (abs_x < 1.0)
+            edge_top = np.abs(plate_z - takes['sz_top'].to_numpy()) < 0.3
+            edge_bot = np.abs(plate_z - takes['sz_bot'].to_numpy()) < 0.3
+            is_edge = edge_x | edge_top | edge_bot
+        else:
+            is_edge = np.zeros(len(takes), dtype=bool)
 
         zone_results = {}
 
         # Analyze edge zone specifically (most interesting)
-        edge_takes = takes[takes['is_edge'] == 1]
+        edge_takes = takes[is_edge]
         if len(edge_takes) >= 15:
             edge_analysis = self._simple_influence_check(edge_takes)
             zone_results['edge'] = {
@@ -338,7 +614,8 @@ class BayesianInfluenceCalculator:
             }
 
         # Overall zone breakdown
-        zone_counts = takes['zone_type'].value_counts().to_dict()
+        zones, counts = np.unique(zone_type, return_counts=True)
+        zone_counts = {str(zone): int(count) for zone, count in zip(zones, counts)}
         zone_results['zone_distribution'] = zone_counts
 
         return zone_results
@@ -347,41 +624,47 @@ class BayesianInfluenceCalculator:
         """
         Simple check: Compare called strike rate for high vs low prior swing rate.
         """
-        takes = takes[takes['pitch_in_ab'] > 1].copy()  # Exclude first pitch
+        after_first = takes['pitch_in_ab'].to_numpy() > 1  # Exclude first pitch
+        rate = takes['prior_swing_rate'].to_numpy()[after_first]
+        strike = takes['is_called_strike'].to_numpy()[after_first]
 
-        if len(takes) < 10:
+        if len(rate) < 10:
             return {'error': 'Insufficient data'}
 
-        # Split by median prior swing rate
-        median_rate = takes['prior_swing_rate'].median()
-        high_swing = takes[takes['prior_swing_rate'] > median_rate]
-        low_swing = takes[takes['prior_swing_rate'] <= median_rate]
+        # Split by median prior swing rate: bin 1 = above the median, bin 0 = at or below
+        high = (rate > np.median(rate)).astype(np.intp)
+        counts = np.bincount(high, minlength=2)
+        low_count, high_count = int(counts[0]), int(counts[1])
 
-        if len(high_swing) < 5 or len(low_swing) < 5:
+        if high_count < 5 or low_count < 5:
             return {'error': 'Insufficient data in groups'}
 
-        high_strike_rate = high_swing['is_called_strike'].mean()
-        low_strike_rate = low_swing['is_called_strike'].mean()
+        low_strike_rate, high_strike_rate = np.bincount(high, weights=strike, minlength=2) / counts
 
         return {
             'high_swing_batters_strike_rate': round(high_strike_rate, 4),
             'low_swing_batters_strike_rate': round(low_strike_rate, 4),
             'difference': round(high_strike_rate - low_strike_rate, 4),
-            'high_swing_count': len(high_swing),
-            'low_swing_count': len(low_swing)
+            'high_swing_count': high_count,
+            'low_swing_count': low_count
         }
 
+    @staticmethod
+    def _swing_take_totals(data: pd.DataFrame) -> tuple:
+        """(swings, takes) summed in one reduction; 0 for a missing column"""
+        columns = [c for c in ('is_swing', 'is_take') if c in data.columns]
+        sums = dict(zip(columns, data[columns].to_numpy().sum(axis=0, dtype=np.int64)))
+        return sums.get('is_swing', 0), sums.get('is_take', 0)
+
     def _calculate_batter_stats(self, all_data: pd.DataFrame, long_ab_data: pd.DataFrame) -> dict:
         """Calculate overall batter statistics."""
-        total_swings = all_data['is_swing'].sum() if 'is_swing' in all_data.columns else 0
-        total_takes = all_data['is_take'].sum() if 'is_take' in all_data.columns else 0
+        total_swings, total_takes = self._swing_take_totals(all_data)
         total = total_swings + total_takes
 
         overall_swing_rate = total_swings / total if total > 0 else 0
 
         # In long at-bats
-        long_swings = long_ab_data['is_swing'].sum() if 'is_swing' in long_ab_data.columns else 0
-        long_takes = long_ab_data['is_take'].sum() if 'is_take' in long_ab_data.columns else 0
+        long_swings, long_takes = self._swing_take_totals(long_ab_data)
         long_total = long_swings + long_takes
 
         long_swing_rate = long_swings / long_total if long_total > 0 else 0
@@ -468,27 +751,42 @@ class BayesianInfluenceCalculator:
             return ("Across batters analyzed, there is evidence that batters with higher swing tendencies "
                     "see more called strikes, contrary to the 'freeswinger effect' hypothesis.")
 
+    def _prefetch_batter_names(self, batter_ids):
+        """Fill the name cache for all uncached batters with one pybaseball lookup."""
+        missing = [int(b) for b in batter_ids if int(b) not in _player_name_cache]
+        if not missing or not PYBASEBALL_AVAILABLE:
+            return
+
+        try:
+            lookup = playerid_reverse_lookup(missing, key_type='mlbam')
+        except Exception as e:
+            logger.warning(f"Could not lookup players {missing}: {e}")
+            return
+
+        for _, row in lookup.iterrows():
+            first_name = str(row.get('name_first', '')).title()
+            last_name = str(row.get('name_last', '')).title()
+            if first_name and last_name:
+                _player_name_cache[int(row['key_mlbam'])] = f"{first_name} {last_name}"
+
     def _get_batter_name(self, data: pd.DataFrame) -> str:
         """Extract batter name from data using pybaseball lookup."""
-        batter_id = int(data['batter'].iloc[0])
+        batter_id = int(data['batter'].iat[0])
 
         # Check cache first
-        if batter_id in _player_name_cache:
-            return _player_name_cache[batter_id]
+        name = _player_name_cache.get(batter_id)
+        if name is not None:
+            return name
 
         # Try pybaseball lookup
         if PYBASEBALL_AVAILABLE:
             try:
-                lookup = playerid_reverse_lookup([batter_id], key_type='mlbam')
-                if not lookup.empty:
-                    first_name = str(lookup.iloc[0].get('name_first', '')).title()
-                    last_name = str(lookup.iloc[0].get('name_last', '')).title()
-                    if first_name and last_name:
-                        name = f"{first_name} {last_name}"
-                        _player_name_cache[batter_id] = name
-                        return name
+                name = _lookup_batter_name(batter_id)
             except Exception as e:
                 logger.warning(f"Could not lookup player {batter_id}: {e}")
+            if name:
+                _player_name_cache[batter_id] = name
+                return name
 
         # Fallback
         return f"Player {batter_id}"
@@ -502,12 +800,10 @@ class BayesianInfluenceCalculator:
         if 'at_bat_number' not in pitch_data.columns:
             return pd.DataFrame(columns=['batter_id', 'name', 'long_at_bats', 'total_pitches'])
 
-        # Create at-bat identifier
-        pitch_data = pitch_data.copy()
-        pitch_data['ab_id'] = pitch_data['game_pk'].astype(str) + '_' + pitch_data['at_bat_number'].astype(str)
-
-        # Count pitches per at-bat
-        ab_sizes = pitch_data.groupby(['batter', 'ab_id']).size().reset_index(name='pitches')
+        # Count pitches per at-bat (game + at_bat_number identifies an at-bat)
+        ab_sizes = pitch_data.groupby(
+            ['batter', 'game_pk', 'at_bat_number'], dropna=False
+        ).size().reset_index(name='pitches')
 
         # Filter to long at-bats
         long_abs = ab_sizes[ab_sizes['pitches'] >= self.MIN_AT_BAT_PITCHES]
@@ -7,10 +7,26 @@ Data is cached locally to avoid repeated API calls.
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import Optional
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import os
+import re
+import json
+import time
+import threading
 import logging
 
+# Copy-on-Write (always on from pandas 3) lets get_data hand out cached
+# frames without defensive copies: a caller's writes copy only what they touch
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -29,6 +45,190 @@ except ImportError:
 # This is a fallback - we'll also use the pitcher column from pitch data
 PITCHER_EXCLUSION_SET = set()
 
+# Statcast columns the SZAS and Bayesian calculations use
+SZAS_COLUMNS = [
+    'game_date', 'game_pk', 'batter', 'pitcher', 'stand', 'p_throws',
+    'plate_x', 'plate_z', 'sz_top', 'sz_bot',
+    'description', 'type', 'zone', 'pitch_type',
+    'release_speed', 'player_name', 'pitch_name',
+    'home_team', 'away_team',
+    'umpire',  # Home plate umpire name - available directly in Statcast!
+    # At-bat tracking columns for Bayesian analysis
+    'at_bat_number', 'pitch_number', 'inning', 'inning_topbot',
+    'balls', 'strikes', 'events'
+]
+
+# Batter name columns kept when the Statcast pull provides them
+BATTER_NAME_COLUMNS = ['batter_name', 'hitter_name']
+
+# Columns read back from the season cache; anything else in an older
+# cache file is skipped at the column-chunk level
+SEASON_COLUMNS = SZAS_COLUMNS + BATTER_NAME_COLUMNS + ['umpire_id', 'umpire_name']
+
+# Low-cardinality string columns stored as dictionary-encoded categoricals
+CATEGORY_COLUMNS = ['stand', 'p_throws', 'pitch_type', 'player_name', 'umpire_name',
+                    'description', 'type', 'pitch_name', 'home_team', 'away_team',
+                    'inning_topbot', 'events']
+
+# Columns _ensure_umpire_data needs to match umpires onto a projected read
+UMPIRE_MATCH_COLUMNS = ['umpire_id', 'umpire_name', 'umpire', 'game_pk',
+                        'game_date', 'home_team', 'away_team']
+
+# Narrower dtypes for the hot numeric columns; halving the element width
+# halves the memory traffic of every filter and zone scan
+DOWNCAST_DTYPES = {
+    'plate_x': 'float32', 'plate_z': 'float32', 'sz_top': 'float32',
+    'sz_bot': 'float32', 'release_speed': 'float32', 'zone': 'float32',
+    'batter': 'int32', 'pitcher': 'int32', 'game_pk': 'int32', 'umpire_id': 'int32',
+    'at_bat_number': 'int16', 'pitch_number': 'int8',
+    'inning': 'int8', 'balls': 'int8', 'strikes': 'int8',
+}
+
+# Parquet writer settings for the season cache
+PARQUET_COMPRESSION = 'zstd'
+PARQUET_COMPRESSION_LEVEL = 3
+# Rows are sorted by batter, so each row group covers a narrow batter range
+# and a single-batter read decodes roughly one group (~25 batters' pitches)
+PARQUET_ROW_GROUP_SIZE = 16_384
+# Rows converted to Arrow per write when saving a season, so only one slice
+# of the season is held as an Arrow table at a time
+PARQUET_WRITE_BATCH_ROWS = 16 * PARQUET_ROW_GROUP_SIZE
+# Schema stamp written into enriched season caches; a stamped file is known
+# to carry umpire data, so loads skip the enrichment check entirely
+CACHE_SCHEMA_KEY = b'szas_schema'
+CACHE_SCHEMA_VERSION = b'v2'
+# Distinct batter / umpire counts, computed once when the season is written
+CACHE_UNIQUE_BATTERS_KEY = b'szas_unique_batters'
+CACHE_UNIQUE_UMPIRES_KEY = b'szas_unique_umpires'
+
+
+# Game-log column detection (column names vary by game-log source)
+GAME_LOG_DATE_COLUMNS = ['Date', 'date', 'game_date', 'GameDate']
+HP_UMPIRE_ID_RE = re.compile(r'^(?=.*hp)(?=.*ump).*id|^umpirehid$', re.IGNORECASE)
+HP_UMPIRE_NAME_RE = re.compile(r'^(?=.*hp)(?=.*ump)(?!.*id)', re.IGNORECASE)
+PLATE_UMPIRE_RE = re.compile(r'^(?=.*umpire)(?=.*(home|hp|plate))', re.IGNORECASE)
+HOME_TEAM_RE = re.compile(r'^(?=.*home)(?=.*team)|^home$', re.IGNORECASE)
+AWAY_TEAM_RE = re.compile(r'away|visit', re.IGNORECASE)
+
+
+def _last_matching_column(columns: list, pattern: re.Pattern, exclude: re.Pattern = None) -> Optional[str]:
+    """Last column name matching pattern (and not exclude), or None."""
+    return next((c for c in reversed(columns)
+                 if pattern.search(c) and not (exclude and exclude.search(c))), None)
+
+
+# Placeholder umpire names that map to umpire_id 0
+UNKNOWN_UMPIRE_NAMES = ['Unknown', 'nan', '<NA>', '']
+
+
+def _unknown_umpire_mask(names: pd.Series) -> np.ndarray:
+    """Boolean mask of missing or placeholder umpire names."""
+    return (names.isna() | names.isin(UNKNOWN_UMPIRE_NAMES)).to_numpy()
+
+
+def _umpire_ids_from_names(names: pd.Series) -> pd.Series:
+    """
+    Derive numeric umpire ids (0 to 999999) for umpire names.
+
+    Each distinct name is hashed once with pandas' vectorized (and, unlike
+    Python's hash(), process-independent) hash; missing and placeholder
+    names get 0.
+    """
+    codes, uniques = pd.factorize(names)
+    unique_names = pd.Series(uniques, dtype=object).astype(str)
+    unique_ids = (pd.util.hash_pandas_object(unique_names, index=False).to_numpy() % 1_000_000).astype(np.int64)
+    unique_ids[_unknown_umpire_mask(unique_names)] = 0
+    # Missing names have code -1, which the trailing 0 catches
+    return pd.Series(np.append(unique_ids, 0)[codes], index=names.index)
+
+
+@dataclass
+class PitchColumns:
+    """
+    Flat key-column arrays for one in-memory season.
+
+    Rows are addressed by position. For batter and umpire_id, `*_order`
+    holds row positions stably sorted by value and `*_sorted` the values in
+    that order, so an equality filter is two binary searches plus a slice.
+    Seasons are kept sorted by batter, in which case batter_order is None
+    and a batter's pitches are the contiguous rows batter_range() returns.
+    Batting side is stored as int8 codes with the ascending row positions
+    of each side precomputed.
+    """
+    batter_order: Optional[np.ndarray]
+    batter_sorted: np.ndarray
+    umpire_order: Optional[np.ndarray]
+    umpire_sorted: Optional[np.ndarray]
+    stand_codes: np.ndarray
+    stand_lookup: dict
+    stand_positions: list
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> 'PitchColumns':
+        batter = data['batter'].to_numpy()
+        if data['batter'].is_monotonic_increasing:
+            batter_order = None
+            batter_sorted = batter
+        else:
+            batter_order = np.argsort(batter, kind='stable')
+            batter_sorted = batter[batter_order]
+        umpire_order = umpire_sorted = None
+        if 'umpire_id' in data.columns:
+            umpire = data['umpire_id'].to_numpy()
+            umpire_order = np.argsort(umpire, kind='stable')
+            umpire_sorted = umpire[umpire_order]
+        codes, sides = pd.factorize(data['stand'].astype(str))
+        codes = codes.astype(np.int8)
+        return cls(
+            batter_order=batter_order,
+            batter_sorted=batter_sorted,
+            umpire_order=umpire_order,
+            umpire_sorted=umpire_sorted,
+            stand_codes=codes,
+            stand_lookup={side: code for code, side in enumerate(sides)},
+            stand_positions=[np.flatnonzero(codes == code) for code in range(len(sides))]
+        )
+
+    @staticmethod
+    def _lookup(order: Optional[np.ndarray], values: np.ndarray, value) -> np.ndarray:
+        lo = np.searchsorted(values, value, side='left')
+        hi = np.searchsorted(values, value, side='right')
+        if order is None:
+            return np.arange(lo, hi)
+        return order[lo:hi]
+
+    def batter_range(self, batter_id: int) -> Optional[tuple]:
+        """(start, stop) rows of a batter when the season is sorted by batter"""
+        if self.batter_order is not None:
+            return None
+        return (int(np.searchsorted(self.batter_sorted, batter_id, side='left')),
+                int(np.searchsorted(self.batter_sorted, batter_id, side='right')))
+
+    def filter_indices(self, batter_id: int = None, umpire_id: int = None,
+                       bat_side: str = None) -> Optional[np.ndarray]:
+        """
+        Ascending row positions matching the filters, or None if no filter
+        was given (i.e. every row matches).
+        """
+        positions = None
+        if batter_id:
+            positions = self._lookup(self.batter_order, self.batter_sorted, batter_id)
+        if umpire_id and self.umpire_order is not None:
+            umpire_positions = self._lookup(self.umpire_order, self.umpire_sorted, umpire_id)
+            positions = umpire_positions if positions is None else np.intersect1d(
+                positions, umpire_positions, assume_unique=True
+            )
+        if bat_side:
+            code = self.stand_lookup.get(bat_side)
+            if code is None:
+                positions = np.empty(0, dtype=np.intp)
+            elif positions is None:
+                positions = self.stand_positions[code]
+            else:
+                # Already narrowed to a few rows - a code check beats an intersect
+                positions = positions[self.stand_codes[positions] == code]
+        return positions
+
 
 class DataLoader:
     """
@@ -39,6 +239,35 @@ class DataLoader:
 
     CACHE_FILE_PATTERN = "statcast_{year}_{month}.parquet"
     FULL_SEASON_PATTERN = "statcast_{year}_full.parquet"
+    # Uncompressed Arrow IPC mirror of the season parquet; memory-mapped so
+    # every gunicorn worker shares one copy of the data via the page cache
+    ARROW_MIRROR_PATTERN = "statcast_{year}.arrow"
+
+    # Derived per-season results, stamped with the season parquet's mtime
+    # and reused until that file is rewritten
+    SUMMARY_SIDECAR_PATTERN = "statcast_{year}_summary.json"
+    BATTERS_SIDECAR_PATTERN = "statcast_{year}_batters.parquet"
+
+    # Bounded cache of filtered frames keyed by (year, batter, umpire, side)
+    FILTER_CACHE_SIZE = 64
+    FILTER_CACHE_TTL = 3600  # seconds
+
+    # Monthly Statcast queries run concurrently when fetching a full season
+    STATCAST_FETCH_WORKERS = 6
+
+    # Retrosheet game-log seasons downloaded concurrently
+    GAME_LOG_FETCH_WORKERS = 8
+
+    # Concurrent MLB Stats API requests when fetching umpire assignments
+    UMPIRE_FETCH_WORKERS = 16
+    # Transient Stats API failures are retried with backoff on the session
+    UMPIRE_FETCH_RETRY = dict(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    # Fetched assignments are journaled to disk as they arrive, fsynced
+    # every this many records, so an interrupted fetch keeps its progress
+    UMPIRE_JOURNAL_SYNC_EVERY = 200
+    # Stats API field filter: the live feed is trimmed server-side to the
+    # boxscore officials, instead of transferring the whole game feed
+    UMPIRE_FEED_FIELDS = 'liveData,boxscore,officials,officialType,official,id,fullName'
 
     def __init__(self):
         # Use /app/data in Docker container, or ../data in local development
@@ -46,52 +275,355 @@ class DataLoader:
             self.DATA_DIR = '/app/data'
         else:
             self.DATA_DIR = os.environ.get('DATA_DIR', os.path.join(os.path.dirname(__file__), '..', 'data'))
+        # Point ARROW_CACHE_DIR at a tmpfs such as /dev/shm when it is large
+        # enough to hold a season; the data directory works as well
+        self.ARROW_DIR = os.environ.get('ARROW_CACHE_DIR', self.DATA_DIR)
         self._data_cache = {}
+        self._filtered_cache = OrderedDict()
+        self._filtered_lock = threading.Lock()
+        # year -> PitchColumns for in-memory seasons
+        self._season_columns = {}
+        # In-flight loads shared by concurrent callers (see _single_flight)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        # batter_id -> name, loaded from the name cache parquet on first use
+        self._player_names = None
+        self._player_names_lock = threading.Lock()
+        # year -> season parquet stamp last seen by season_version
+        self._season_versions = {}
+        # The umpire cache and journal files are shared by all seasons;
+        # seasons downloading concurrently take turns reading and rewriting
+        # them, while their API requests overlap
+        self._umpire_cache_lock = threading.Lock()
         os.makedirs(self.DATA_DIR, exist_ok=True)
 
+    def clear_cache(self, year: int = None):
+        """
+        Drop in-memory cached data.
+
+        Args:
+            year: Only drop entries for this season (default: everything)
+        """
+        with self._filtered_lock:
+            if year is None:
+                self._data_cache.clear()
+                self._filtered_cache.clear()
+                self._season_columns.clear()
+                return
+            for key in [k for k in self._data_cache if k.startswith(f"{year}_")]:
+                del self._data_cache[key]
+            for key in [k for k in self._filtered_cache if k[0] == year]:
+                del self._filtered_cache[key]
+            self._season_columns.pop(year, None)
+
     def get_data(self, year: int = 2024, batter_id: int = None,
-                 use_cache: bool = True) -> pd.DataFrame:
+                 umpire_id: int = None, bat_side: str = None,
+                 columns: list = None, use_cache: bool = True) -> pd.DataFrame:
         """
         Get pitch data - primary method for fetching data.
 
+        Filters are applied inside the loader so callers never have to
+        materialize the full season just to throw most of it away. When the
+        season is not yet in memory, the predicates are pushed down into the
+        parquet scan so only matching row groups are decoded.
+
         Args:
             year: Season year (2015-2024 have good Statcast coverage)
             batter_id: Optional MLB player ID to filter by
+            umpire_id: Optional home plate umpire ID to filter by
+            bat_side: Optional batting side ('L' or 'R') to filter by
+            columns: Optional list of columns the caller needs. Columns
+                missing from the data are silently skipped.
             use_cache: Whether to use cached data (default True)
 
         Returns:
-            DataFrame with pitch-level Statcast data
+            DataFrame with pitch-level Statcast data. Frames share memory
+            with the loader's caches under Copy-on-Write, so callers may
+            modify them freely; only the columns they write are copied.
+        """
+        # Drops this process's copy of the season if another one rewrote it
+        self.season_version(year)
+
+        has_filters = bool(batter_id or umpire_id or bat_side)
+
+        if not (use_cache and has_filters):
+            return self._get_data_uncached(year, batter_id, umpire_id, bat_side, columns, use_cache)
+
+        # Serve repeated filter combinations from the bounded TTL cache
+        filter_key = (year, batter_id, umpire_id, bat_side, tuple(columns) if columns else None)
+        now = time.monotonic()
+        with self._filtered_lock:
+            entry = self._filtered_cache.get(filter_key)
+            if entry is not None and now - entry[0] < self.FILTER_CACHE_TTL:
+                self._filtered_cache.move_to_end(filter_key)
+                return entry[1].copy(deep=False)
+
+        data = self._get_data_uncached(year, batter_id, umpire_id, bat_side, columns, use_cache)
+
+        if data is not None:
+            with self._filtered_lock:
+                self._filtered_cache[filter_key] = (now, data)
+                self._filtered_cache.move_to_end(filter_key)
+                while len(self._filtered_cache) > self.FILTER_CACHE_SIZE:
+                    self._filtered_cache.popitem(last=False)
+            data = data.copy(deep=False)
+
+        return data
+
+    def get_batter_slice(self, year: int, batter_id: int) -> pd.DataFrame:
         """
-        # Try to load from local cache first
+        Get all pitches to one batter with a single gather.
+
+        When the season is in memory this skips the filtered-frame cache.
+        The result may be a slice of the cached season; Copy-on-Write keeps
+        a caller's writes from reaching the cache.
+        """
+        self.season_version(year)
+        if f"{year}_all" in self._data_cache:
+            return self.filter_by(year, batter_id=batter_id)
+        return self.get_data(year=year, batter_id=batter_id)
+
+    def _get_data_uncached(self, year: int, batter_id: int = None,
+                           umpire_id: int = None, bat_side: str = None,
+                           columns: list = None, use_cache: bool = True) -> pd.DataFrame:
+        """Resolve pitch data from memory, disk, or Statcast (see get_data)"""
+        has_filters = bool(batter_id or umpire_id or bat_side)
+
+        # Try the in-memory season cache first, then a batter-scoped entry
+        full_key = f"{year}_all"
         cache_key = f"{year}_{batter_id or 'all'}"
 
-        if use_cache and cache_key in self._data_cache:
-            logger.info(f"Returning data from memory cache: {cache_key}")
-            return self._data_cache[cache_key].copy()
+        if use_cache:
+            if full_key in self._data_cache:
+                logger.info(f"Returning data from memory cache: {full_key}")
+                data = self.filter_by(year, batter_id, umpire_id, bat_side)
+                return self._select_columns(data, columns).copy(deep=False)
+            if cache_key in self._data_cache:
+                logger.info(f"Returning data from memory cache: {cache_key}")
+                data = self._apply_filters(self._data_cache[cache_key], batter_id, umpire_id, bat_side)
+                return self._select_columns(data, columns).copy(deep=False)
 
         # Try to load from disk cache
         if use_cache:
-            cached_data = self._load_from_disk_cache(year)
+            if has_filters:
+                # Season not in memory yet - only decode the matching rows
+                # (and, when a projection is given, only the needed columns)
+                projection = list(dict.fromkeys(columns + UMPIRE_MATCH_COLUMNS)) if columns else None
+                filtered = self._load_from_disk_cache(
+                    year,
+                    filters=self._build_parquet_filters(batter_id, umpire_id, bat_side),
+                    columns=projection
+                )
+                # A cache written before umpire enrichment is loaded as a
+                # season below, enriched once and rewritten, rather than
+                # re-enriching every filtered read
+                if filtered is not None and len(filtered) > 0 and (
+                        self._is_enriched_cache(year) or self._has_umpire_data(filtered)):
+                    return self._select_columns(filtered, columns)
+
+            cached_data = self._single_flight(('disk', year), lambda: self._load_season(year))
             if cached_data is not None:
-                # Enrich with umpire data if not already present
-                cached_data = self._ensure_umpire_data(cached_data)
-
-                if batter_id:
-                    cached_data = cached_data[cached_data['batter'] == batter_id]
-                self._data_cache[cache_key] = cached_data
-                return cached_data.copy()
+                data = self.filter_by(year, batter_id, umpire_id, bat_side)
+                return self._select_columns(data, columns).copy(deep=False)
 
         # Fetch fresh data from Statcast
+        data = self._single_flight(('fetch', year, batter_id),
+                                   lambda: self._fetch_and_cache(year, batter_id))
+
+        if data is not None and len(data) > 0:
+            data = self._select_columns(self._apply_filters(data, batter_id, umpire_id, bat_side), columns)
+
+        return data
+
+    def _fetch_and_cache(self, year: int, batter_id: int = None) -> pd.DataFrame:
+        """Fetch from Statcast and store the result in the memory/disk caches."""
         data = self._fetch_statcast_data(year, batter_id)
 
         if data is not None and len(data) > 0:
-            self._data_cache[cache_key] = data
+            data = self._optimize_dtypes(data)
+            if batter_id is None:
+                data = self._sort_by_batter(data)
+            self._data_cache[f"{year}_{batter_id or 'all'}"] = data
+            # Key-column arrays were built against the frame being replaced
+            self._season_columns.pop(year, None)
             # Save full season to disk if we fetched all batters
             if batter_id is None:
                 self._save_to_disk_cache(data, year)
 
         return data
 
+    def _load_season(self, year: int) -> pd.DataFrame:
+        """Load a season from the disk cache into the memory cache."""
+        full_key = f"{year}_all"
+        if full_key in self._data_cache:
+            return self._data_cache[full_key]
+
+        cached_data = self._load_from_disk_cache(year)
+        if cached_data is not None:
+            # Enrich with umpire data if not already present, and persist the
+            # enriched season so later loads skip the enrichment pass
+            enriched = cached_data if self._is_enriched_cache(year) else self._ensure_umpire_data(cached_data)
+            if enriched is not cached_data and self._has_umpire_data(enriched):
+                self._save_to_disk_cache(enriched, year)
+            cached_data = self._optimize_dtypes(enriched)
+            # No-op for caches written by _save_to_disk_cache (already sorted)
+            cached_data = self._sort_by_batter(cached_data)
+            self._data_cache[full_key] = cached_data
+        return cached_data
+
+    def _is_enriched_cache(self, year: int) -> bool:
+        """Whether the season parquet carries the CACHE_SCHEMA_VERSION stamp."""
+        cache_file = os.path.join(self.DATA_DIR, self.FULL_SEASON_PATTERN.format(year=year))
+        try:
+            metadata = pq.read_schema(cache_file).metadata or {}
+        except Exception:
+            return False
+        return metadata.get(CACHE_SCHEMA_KEY) == CACHE_SCHEMA_VERSION
+
+    def _single_flight(self, key, load):
+        """
+        Run load() once for concurrent callers with the same key.
+
+        The first caller performs the load; callers arriving while it is in
+        flight block on the same Future and share its result (or exception)
+        instead of reading/fetching the same season again.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = load()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def filter_by(self, year: int, batter_id: int = None, umpire_id: int = None,
+                  bat_side: str = None) -> pd.DataFrame:
+        """
+        Filter an in-memory season through its PitchColumns arrays.
+
+        Matching row positions are resolved on flat numpy arrays and the
+        DataFrame is only touched once, to gather those rows. The season
+        must already be in the memory cache.
+        """
+        data = self._data_cache[f"{year}_all"]
+        columns = self._season_columns.get(year)
+        if columns is None:
+            columns = self._season_columns[year] = PitchColumns.from_frame(data)
+
+        if batter_id and not (umpire_id or bat_side):
+            # Batter-sorted season: the batter's rows are one contiguous slice
+            bounds = columns.batter_range(batter_id)
+            if bounds is not None:
+                return data.iloc[bounds[0]:bounds[1]]
+
+        positions = columns.filter_indices(batter_id, umpire_id, bat_side)
+        if positions is None:
+            return data
+        return data.take(positions)
+
+    @staticmethod
+    def _sort_by_batter(data: pd.DataFrame) -> pd.DataFrame:
+        """Stable-sort a season by batter so each batter's pitches are contiguous."""
+        if 'batter' not in data.columns or data['batter'].is_monotonic_increasing:
+            return data
+        return data.sort_values('batter', kind='stable', ignore_index=True)
+
+    @classmethod
+    def _optimize_dtypes(cls, data: pd.DataFrame) -> pd.DataFrame:
+        """Downcast numeric columns and dictionary-encode CATEGORY_COLUMNS."""
+        data = cls._downcast_numeric(data)
+        categories = {
+            c: 'category' for c in CATEGORY_COLUMNS
+            if c in data.columns and not isinstance(data[c].dtype, pd.CategoricalDtype)
+        }
+        if not categories:
+            return data
+        return data.astype(categories)
+
+    @staticmethod
+    def _downcast_numeric(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast hot numeric columns to the narrower DOWNCAST_DTYPES.
+
+        Integer casts are skipped for columns with missing or out-of-range
+        values, and columns already at the target dtype are left untouched.
+        """
+        casts = {}
+        for col, dtype in DOWNCAST_DTYPES.items():
+            if col not in data.columns or data[col].dtype == dtype:
+                continue
+            if not pd.api.types.is_numeric_dtype(data[col]):
+                continue
+            if dtype.startswith('int'):
+                values = data[col]
+                info = np.iinfo(dtype)
+                if values.isna().any() or len(values) == 0 or values.min() < info.min or values.max() > info.max:
+                    continue
+            casts[col] = dtype
+        if not casts:
+            return data
+        return data.astype(casts)
+
+    @staticmethod
+    def _select_columns(data: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+        """Project a frame onto the requested columns that it actually has."""
+        if not columns:
+            return data
+        return data[[c for c in columns if c in data.columns]]
+
+    @staticmethod
+    def _apply_filters(data: pd.DataFrame, batter_id: int = None,
+                       umpire_id: int = None, bat_side: str = None) -> pd.DataFrame:
+        """
+        Apply batter/umpire/side equality filters to an in-memory frame.
+
+        Predicates are reduced into one boolean mask and the frame is
+        gathered once by position, rather than materializing a copy per
+        filter.
+        """
+        masks = []
+        if batter_id:
+            masks.append(data['batter'].to_numpy() == batter_id)
+        if umpire_id and 'umpire_id' in data.columns:
+            masks.append(data['umpire_id'].to_numpy() == umpire_id)
+        if bat_side:
+            masks.append((data['stand'] == bat_side).to_numpy())
+        if not masks:
+            return data
+        return data.take(np.flatnonzero(np.logical_and.reduce(masks)))
+
+    @staticmethod
+    def _build_parquet_filters(batter_id: int = None, umpire_id: int = None,
+                               bat_side: str = None) -> list:
+        """Build pyarrow filter predicates for row-group pruning."""
+        filters = []
+        if batter_id:
+            filters.append(('batter', '=', int(batter_id)))
+        if umpire_id:
+            filters.append(('umpire_id', '=', int(umpire_id)))
+        if bat_side:
+            filters.append(('stand', '=', bat_side))
+        return filters
+
+    @staticmethod
+    def _has_umpire_data(data: pd.DataFrame) -> bool:
+        """Whether umpire columns are present with actual (non-zero) umpire ids."""
+        if 'umpire_id' not in data.columns or 'umpire_name' not in data.columns:
+            return False
+        return bool((data['umpire_id'].to_numpy() != 0).any())
+
     def _ensure_umpire_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Ensure umpire data is present in the dataframe.
@@ -101,16 +633,9 @@ class DataLoader:
         This allows us to add umpire data to previously cached data
         without re-downloading from Statcast.
         """
-        # Check if umpire data is already present and valid
-        has_umpire_id = 'umpire_id' in data.columns
-        has_umpire_name = 'umpire_name' in data.columns
-
-        if has_umpire_id and has_umpire_name:
-            # Check if we have actual umpire data (not all zeros/Unknown)
-            valid_umpires = (data['umpire_id'] != 0).sum()
-            if valid_umpires > 0:
-                logger.info(f"Umpire data already present: {valid_umpires} pitches with umpire info")
-                return data
+        if self._has_umpire_data(data):
+            logger.info(f"Umpire data already present: {(data['umpire_id'] != 0).sum()} pitches with umpire info")
+            return data
 
         # Check if we have the columns needed to match umpires
         has_game_pk = 'game_pk' in data.columns
@@ -181,8 +706,14 @@ class DataLoader:
     def _fetch_season_in_chunks(self, year: int, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Fetch a full season in monthly chunks to avoid timeouts.
+
+        The monthly queries are independent, so they run on a thread pool
+        and overlap Savant's server-side query time. Each chunk is projected
+        onto the columns _clean_statcast_data keeps as it arrives, so the
+        final concat (in calendar order) only copies those columns.
         """
-        all_data = []
+        keep = SZAS_COLUMNS + BATTER_NAME_COLUMNS
+        chunks = []
 
         start = datetime.strptime(start_date, "%Y-%m-%d")
         end = datetime.strptime(end_date, "%Y-%m-%d")
@@ -199,22 +730,29 @@ class DataLoader:
             if month_end > end:
                 month_end = end
 
-            chunk_start = current.strftime("%Y-%m-%d")
-            chunk_end = month_end.strftime("%Y-%m-%d")
-
-            logger.info(f"Fetching chunk: {chunk_start} to {chunk_end}")
-
-            try:
-                chunk = statcast(chunk_start, chunk_end)
-                if chunk is not None and len(chunk) > 0:
-                    all_data.append(chunk)
-                    logger.info(f"  Got {len(chunk)} pitches")
-            except Exception as e:
-                logger.warning(f"  Error fetching chunk: {e}")
+            chunks.append((current.strftime("%Y-%m-%d"), month_end.strftime("%Y-%m-%d")))
 
             # Move to next month
             current = month_end + timedelta(days=1)
 
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.STATCAST_FETCH_WORKERS) as executor:
+            futures = {}
+            for chunk_start, chunk_end in chunks:
+                logger.info(f"Fetching chunk: {chunk_start} to {chunk_end}")
+                futures[executor.submit(statcast, chunk_start, chunk_end)] = (chunk_start, chunk_end)
+
+            for future in as_completed(futures):
+                chunk_start, chunk_end = futures[future]
+                try:
+                    chunk = future.result()
+                    if chunk is not None and len(chunk) > 0:
+                        results[chunk_start] = chunk[[c for c in keep if c in chunk.columns]]
+                        logger.info(f"  Got {len(chunk)} pitches for {chunk_start} to {chunk_end}")
+                except Exception as e:
+                    logger.warning(f"  Error fetching chunk {chunk_start} to {chunk_end}: {e}")
+
+        all_data = [results[chunk_start] for chunk_start, _ in chunks if chunk_start in results]
         if all_data:
             return pd.concat(all_data, ignore_index=True)
         return None
@@ -233,28 +771,8 @@ class DataLoader:
         # Log available columns for debugging
         logger.info(f"Available Statcast columns: {list(data.columns)}")
 
-        # Columns we need for SZAS calculation
-        required_cols = [
-            'game_date', 'game_pk', 'batter', 'pitcher', 'stand', 'p_throws',
-            'plate_x', 'plate_z', 'sz_top', 'sz_bot',
-            'description', 'type', 'zone', 'pitch_type',
-            'release_speed', 'player_name', 'pitch_name',
-            'home_team', 'away_team',
-            'umpire',  # Home plate umpire name - available directly in Statcast!
-            # At-bat tracking columns for Bayesian analysis
-            'at_bat_number', 'pitch_number', 'inning', 'inning_topbot',
-            'balls', 'strikes', 'events'
-        ]
-
-        # Also grab batter name columns if available
-        # In Statcast, these might be: 'batter_name', 'bat_name', or similar
-        batter_name_cols = ['batter_name', 'hitter_name']
-        for col in batter_name_cols:
-            if col in data.columns:
-                required_cols.append(col)
-
-        # Keep only available columns
-        available_cols = [c for c in required_cols if c in data.columns]
+        # Keep only the columns SZAS needs (plus batter names, if available)
+        available_cols = [c for c in SZAS_COLUMNS + BATTER_NAME_COLUMNS if c in data.columns]
         data = data[available_cols].copy()
 
         # Remove rows with missing critical data
@@ -278,7 +796,14 @@ class DataLoader:
 
         Uses MLB Stats API to look up umpire by game_pk (most reliable).
         Falls back to checking if 'umpire' column in Statcast has data.
+        Data that already carries umpire ids is returned unchanged.
         """
+        if self._has_umpire_data(data):
+            logger.info("Umpire data already enriched")
+            return data
+        # Placeholder columns (all umpire_id 0) would collide with the merges below
+        data = data.drop(columns=['umpire_id', 'umpire_name'], errors='ignore')
+
         logger.info(f"Adding umpire data. Available columns: {list(data.columns)}")
 
         # Strategy 1: Check if 'umpire' column has actual data (not all NaN)
@@ -287,15 +812,8 @@ class DataLoader:
             non_null = data['umpire'].notna().sum()
             if non_null > 0:
                 logger.info(f"Using 'umpire' column from Statcast ({non_null} non-null values)")
-                data['umpire_name'] = data['umpire'].astype(str).replace('nan', 'Unknown').replace('<NA>', 'Unknown').replace('', 'Unknown')
-
-                def safe_hash(name):
-                    if not name or name == 'Unknown' or name == 'nan' or name == '<NA>' or pd.isna(name):
-                        return 0
-                    return int(abs(hash(str(name))) % 1000000)
-
-                data['umpire_id'] = data['umpire_name'].apply(safe_hash)
-                data['umpire_id'] = data['umpire_id'].astype(int)
+                data['umpire_name'] = data['umpire'].mask(_unknown_umpire_mask(data['umpire']), 'Unknown')
+                data['umpire_id'] = _umpire_ids_from_names(data['umpire_name'])
 
                 valid_umpires = (data['umpire_id'] != 0).sum()
                 if valid_umpires > 0:
@@ -374,17 +892,21 @@ class DataLoader:
         # Match on date + teams
         elif has_home_team and has_away_team and 'home_team' in umpire_map.columns:
             logger.info("Matching umpires using date + teams")
-            data['game_date_str'] = data['game_date'].dt.strftime('%Y-%m-%d')
+            games = umpire_map[['date', 'home_team', 'away_team', 'umpire_id', 'umpire_name']].drop_duplicates()
+            # Day numbers and team codes over one shared vocabulary, so the
+            # merge hashes integers rather than comparing strings
+            teams = pd.Index(np.concatenate([
+                np.asarray(frame[col].dropna().unique(), dtype=object)
+                for frame in (data, games) for col in ('home_team', 'away_team')
+            ])).unique()
+            keys = ['_day', '_home', '_away']
+            data = data.assign(**self._date_team_keys(data['game_date'], data['home_team'], data['away_team'], teams))
+            games = games.assign(**self._date_team_keys(games['date'], games['home_team'], games['away_team'], teams))
             data = data.merge(
-                umpire_map[['date', 'home_team', 'away_team', 'umpire_id', 'umpire_name']].drop_duplicates(),
-                left_on=['game_date_str', 'home_team', 'away_team'],
-                right_on=['date', 'home_team', 'away_team'],
+                games[keys + ['umpire_id', 'umpire_name']],
+                on=keys,
                 how='left'
-            )
-            if 'game_date_str' in data.columns:
-                data = data.drop(columns=['game_date_str'])
-            if 'date' in data.columns:
-                data = data.drop(columns=['date'])
+            ).drop(columns=keys)
         else:
             logger.warning("Insufficient columns for umpire matching")
             data['umpire_id'] = 0
@@ -406,6 +928,20 @@ class DataLoader:
 
         return data
 
+    @staticmethod
+    def _day_numbers(dates: pd.Series) -> np.ndarray:
+        """Dates (datetimes or 'YYYY-MM-DD' strings) as int32 days since the epoch."""
+        return pd.to_datetime(dates).to_numpy().astype('datetime64[D]').astype(np.int32)
+
+    @staticmethod
+    def _date_team_keys(dates: pd.Series, home: pd.Series, away: pd.Series, teams: pd.Index) -> dict:
+        """Integer merge keys (days since epoch, team codes) for date + teams matching."""
+        return {
+            '_day': DataLoader._day_numbers(dates),
+            '_home': pd.Categorical(home, categories=teams).codes,
+            '_away': pd.Categorical(away, categories=teams).codes,
+        }
+
     def _fetch_umpires_from_mlb_api(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Fetch home plate umpire data from MLB Stats API.
@@ -416,7 +952,8 @@ class DataLoader:
         Returns DataFrame with: game_pk, umpire_id, umpire_name
         """
         import requests
-        import time
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
 
         # Get unique game_pks
         game_pks = data['game_pk'].dropna().unique()
@@ -424,14 +961,9 @@ class DataLoader:
 
         # Check for cached umpire data
         cache_file = os.path.join(self.DATA_DIR, 'umpire_api_cache.parquet')
-        cached_umpires = None
-
-        if os.path.exists(cache_file):
-            try:
-                cached_umpires = pd.read_parquet(cache_file)
-                logger.info(f"Loaded {len(cached_umpires)} cached umpire assignments")
-            except Exception as e:
-                logger.warning(f"Could not load umpire cache: {e}")
+        journal_file = os.path.join(self.DATA_DIR, 'umpire_api_cache.jsonl')
+        with self._umpire_cache_lock:
+            cached_umpires = self._merge_umpire_cache(cache_file, journal_file)
 
         # Determine which games need fetching
         if cached_umpires is not None:
@@ -451,75 +983,165 @@ class DataLoader:
         failed_count = 0
         success_count = 0
 
-        for i, game_pk in enumerate(new_game_pks):
-            if i > 0 and i % 100 == 0:
-                logger.info(f"  Progress: {i}/{len(new_game_pks)} games ({success_count} success, {failed_count} failed)")
+        # Requests run concurrently over one pooled session, so each game
+        # costs roughly one round trip; the worker count bounds the load on
+        # the API in place of the old sleep-based rate limit
+        workers = self.UMPIRE_FETCH_WORKERS
+        with requests.Session() as session:
+            session.mount('https://', HTTPAdapter(
+                pool_connections=1, pool_maxsize=workers, max_retries=Retry(**self.UMPIRE_FETCH_RETRY)
+            ))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='umpire-fetch') as executor:
+                futures = {
+                    executor.submit(self._fetch_game_umpire, session, game_pk): game_pk
+                    for game_pk in new_game_pks
+                }
+                for i, future in enumerate(as_completed(futures)):
+                    if i > 0 and i % 100 == 0:
+                        logger.info(f"  Progress: {i}/{len(new_game_pks)} games ({success_count} success, {failed_count} failed)")
 
-            try:
-                url = f'https://statsapi.mlb.com/api/v1.1/game/{int(game_pk)}/feed/live'
-                response = requests.get(url, timeout=10)
-
-                if response.status_code == 200:
-                    game_data = response.json()
-
-                    # Look for home plate umpire in officials
-                    officials = game_data.get('liveData', {}).get('boxscore', {}).get('officials', [])
-
-                    hp_umpire = None
-                    for official in officials:
-                        if official.get('officialType') == 'Home Plate':
-                            hp_umpire = official.get('official', {})
-                            break
-
-                    if hp_umpire:
-                        umpire_name = hp_umpire.get('fullName', 'Unknown')
-                        # Use MLB's official ID or create hash from name
-                        umpire_id = hp_umpire.get('id', abs(hash(umpire_name)) % 1000000)
-
-                        new_records.append({
-                            'game_pk': int(game_pk),
-                            'umpire_id': int(umpire_id),
-                            'umpire_name': umpire_name
-                        })
+                    try:
+                        record = future.result()
+                    except Exception as e:
+                        failed_count += 1
+                        if failed_count < 10:
+                            logger.warning(f"  Error fetching game {futures[future]}: {e}")
+                        continue
+
+                    if record is None:
+                        failed_count += 1
+                        continue
+
+                    new_records.append(record)
+                    with self._umpire_cache_lock:
+                        # Reopened per record, since another season's save
+                        # may have coalesced and removed the journal
+                        with open(journal_file, 'a') as journal:
+                            journal.write(json.dumps(record) + '\n')
+                            if len(new_records) % self.UMPIRE_JOURNAL_SYNC_EVERY == 0:
+                                journal.flush()
+                                os.fsync(journal.fileno())
+
+                    if record['umpire_id']:
                         success_count += 1
                     else:
-                        # No home plate umpire found, add placeholder
-                        new_records.append({
-                            'game_pk': int(game_pk),
-                            'umpire_id': 0,
-                            'umpire_name': 'Unknown'
-                        })
+                        # No home plate umpire found, placeholder recorded
                         failed_count += 1
-                else:
-                    failed_count += 1
-
-                # Rate limiting - be nice to the API
-                if i > 0 and i % 50 == 0:
-                    time.sleep(0.5)
-
-            except Exception as e:
-                failed_count += 1
-                if failed_count < 10:
-                    logger.warning(f"  Error fetching game {game_pk}: {e}")
 
         logger.info(f"Fetched umpire data: {success_count} success, {failed_count} failed")
 
-        # Combine with cached data
-        if new_records:
-            new_df = pd.DataFrame(new_records)
-            all_umpires = pd.concat([cached_umpires, new_df], ignore_index=True)
-            all_umpires = all_umpires.drop_duplicates(subset=['game_pk'], keep='first')
+        # Combine with cached data; the cache is re-read, since concurrent
+        # seasons may have saved their own assignments in the meantime
+        with self._umpire_cache_lock:
+            return self._merge_umpire_cache(
+                cache_file, journal_file, pd.DataFrame(new_records) if new_records else None
+            )
+
+    def _merge_umpire_cache(self, cache_file: str, journal_file: str,
+                            new_umpires: pd.DataFrame = None) -> Optional[pd.DataFrame]:
+        """
+        Read the umpire parquet cache, coalescing journaled and new assignments into it.
 
-            # Save updated cache
+        Callers hold _umpire_cache_lock. Returns None if there are no
+        assignments at all.
+        """
+        cached_umpires = None
+        if os.path.exists(cache_file):
             try:
-                all_umpires.to_parquet(cache_file, index=False)
-                logger.info(f"Cached {len(all_umpires)} umpire assignments")
+                cached_umpires = pd.read_parquet(cache_file)
+                logger.info(f"Loaded {len(cached_umpires)} cached umpire assignments")
             except Exception as e:
-                logger.warning(f"Could not save umpire cache: {e}")
+                logger.warning(f"Could not load umpire cache: {e}")
+
+        # Recover assignments journaled by a fetch that did not finish (or
+        # is still running for another season)
+        journaled = self._read_umpire_journal(journal_file)
+        if journaled is not None:
+            logger.info(f"Recovered {len(journaled)} umpire assignments from {journal_file}")
+
+        if journaled is None and new_umpires is None:
+            return cached_umpires
+        parts = [df for df in (cached_umpires, journaled, new_umpires) if df is not None]
+        return self._save_umpire_cache(pd.concat(parts, ignore_index=True), cache_file, journal_file)
 
-            return all_umpires
+    @staticmethod
+    def _read_umpire_journal(journal_file: str) -> Optional[pd.DataFrame]:
+        """Records appended to the umpire fetch journal, or None if there are none."""
+        if not os.path.exists(journal_file):
+            return None
+
+        records = []
+        with open(journal_file) as journal:
+            for line in journal:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # A write cut off by an interruption
+                    continue
+
+        if not records:
+            return None
+        return pd.DataFrame(records)
+
+    @staticmethod
+    def _save_umpire_cache(umpires: pd.DataFrame, cache_file: str, journal_file: str) -> pd.DataFrame:
+        """
+        Coalesce umpire assignments into the parquet cache.
 
-        return cached_umpires
+        The journal is removed only once the parquet has been written, so
+        no fetched record is lost if saving fails.
+        """
+        umpires = umpires.drop_duplicates(subset=['game_pk'], keep='first')
+
+        try:
+            umpires.to_parquet(cache_file, index=False)
+            logger.info(f"Cached {len(umpires)} umpire assignments")
+            if os.path.exists(journal_file):
+                os.remove(journal_file)
+        except Exception as e:
+            logger.warning(f"Could not save umpire cache: {e}")
+
+        return umpires
+
+    @classmethod
+    def _fetch_game_umpire(cls, session, game_pk) -> Optional[dict]:
+        """
+        Look up one game's home plate umpire from the MLB Stats API.
+
+        Returns a game_pk/umpire_id/umpire_name record (umpire_id 0 and
+        'Unknown' when the feed lists no home plate umpire), or None if the
+        request did not succeed.
+        """
+        url = f'https://statsapi.mlb.com/api/v1.1/game/{int(game_pk)}/feed/live'
+        response = session.get(url, params={'fields': cls.UMPIRE_FEED_FIELDS}, timeout=10)
+
+        if response.status_code != 200:
+            return None
+
+        game_data = response.json()
+
+        # Look for home plate umpire in officials
+        officials = game_data.get('liveData', {}).get('boxscore', {}).get('officials', [])
+
+        hp_umpire = None
+        for official in officials:
+            if official.get('officialType') == 'Home Plate':
+                hp_umpire = official.get('official', {})
+                break
+
+        if not hp_umpire:
+            # No home plate umpire found, add placeholder
+            return {'game_pk': int(game_pk), 'umpire_id': 0, 'umpire_name': 'Unknown'}
+
+        umpire_name = hp_umpire.get('fullName', 'Unknown')
+        # Use MLB's official ID or create hash from name
+        umpire_id = hp_umpire.get('id', abs(hash(umpire_name)) % 1000000)
+
+        return {
+            'game_pk': int(game_pk),
+            'umpire_id': int(umpire_id),
+            'umpire_name': umpire_name
+        }
 
     def _load_umpire_game_logs(self, years, pitch_data: pd.DataFrame = None) -> pd.DataFrame:
         """
@@ -531,13 +1153,14 @@ class DataLoader:
         cache_file = os.path.join(self.DATA_DIR, 'umpire_game_logs.parquet')
 
         # Check cache first
-        if os.path.exists(cache_file):
-            try:
-                cached = pd.read_parquet(cache_file)
-                logger.info(f"Loaded {len(cached)} umpire game assignments from cache")
-                return cached
-            except Exception as e:
-                logger.warning(f"Could not load umpire cache: {e}")
+        with self._umpire_cache_lock:
+            if os.path.exists(cache_file):
+                try:
+                    cached = pd.read_parquet(cache_file)
+                    logger.info(f"Loaded {len(cached)} umpire game assignments from cache")
+                    return cached
+                except Exception as e:
+                    logger.warning(f"Could not load umpire cache: {e}")
 
         if not PYBASEBALL_AVAILABLE:
             logger.warning("pybaseball not available - cannot load umpire data")
@@ -546,16 +1169,27 @@ class DataLoader:
         try:
             from pybaseball import season_game_logs
 
-            all_logs = []
-            for year in years:
-                logger.info(f"Loading {year} game logs for umpire data...")
-                try:
-                    logs = season_game_logs(int(year))
-                    if logs is not None and len(logs) > 0:
-                        all_logs.append(logs)
-                        logger.info(f"  Loaded {len(logs)} games for {year}")
-                except Exception as e:
-                    logger.warning(f"  Could not load {year} game logs: {e}")
+            # Seasons are independent downloads, so overlap them; logs are
+            # concatenated in year order regardless of completion order
+            years = [int(year) for year in years]
+            loaded = {}
+            with ThreadPoolExecutor(max_workers=max(1, min(self.GAME_LOG_FETCH_WORKERS, len(years)))) as executor:
+                futures = {}
+                for year in years:
+                    logger.info(f"Loading {year} game logs for umpire data...")
+                    futures[executor.submit(season_game_logs, year)] = year
+
+                for future in as_completed(futures):
+                    year = futures[future]
+                    try:
+                        logs = future.result()
+                        if logs is not None and len(logs) > 0:
+                            loaded[year] = logs
+                            logger.info(f"  Loaded {len(logs)} games for {year}")
+                    except Exception as e:
+                        logger.warning(f"  Could not load {year} game logs: {e}")
+
+            all_logs = [loaded[year] for year in years if year in loaded]
 
             if not all_logs:
                 logger.warning("No game logs loaded")
@@ -568,30 +1202,17 @@ class DataLoader:
             logger.info(f"Game log columns: {list(game_logs.columns)}")
 
             # Build umpire mapping - column names vary by source
-            umpire_cols = [c for c in game_logs.columns if 'ump' in c.lower() or 'hp' in c.lower()]
+            columns = list(game_logs.columns)
+            umpire_cols = [c for c in columns if 'ump' in c.lower() or 'hp' in c.lower()]
             logger.info(f"Found umpire-related columns: {umpire_cols}")
 
             # Try to find the home plate umpire column
-            hp_ump_col = None
-            hp_ump_id_col = None
-            for col in game_logs.columns:
-                col_lower = col.lower()
-                if 'hp' in col_lower and 'ump' in col_lower:
-                    if 'id' in col_lower or 'ID' in col:
-                        hp_ump_id_col = col
-                    else:
-                        hp_ump_col = col
-                elif col_lower in ['hp_umpire_name', 'umpire_hp', 'hp_umpire']:
-                    hp_ump_col = col
-                elif col_lower in ['hp_umpire_id', 'umpirehid']:
-                    hp_ump_id_col = col
+            hp_ump_col = _last_matching_column(columns, HP_UMPIRE_NAME_RE)
+            hp_ump_id_col = _last_matching_column(columns, HP_UMPIRE_ID_RE)
 
             if hp_ump_col is None and hp_ump_id_col is None:
                 # Try alternative patterns
-                for col in game_logs.columns:
-                    if 'umpire' in col.lower() and ('home' in col.lower() or 'hp' in col.lower() or 'plate' in col.lower()):
-                        hp_ump_col = col
-                        break
+                hp_ump_col = next((c for c in columns if PLATE_UMPIRE_RE.search(c)), None)
 
             if hp_ump_col is None and hp_ump_id_col is None:
                 logger.warning("Could not find home plate umpire column in game logs")
@@ -599,20 +1220,9 @@ class DataLoader:
                 return None
 
             # Build the umpire map
-            date_col = None
-            for col in ['Date', 'date', 'game_date', 'GameDate']:
-                if col in game_logs.columns:
-                    date_col = col
-                    break
-
-            home_col = None
-            away_col = None
-            for col in game_logs.columns:
-                col_lower = col.lower()
-                if 'home' in col_lower and ('team' in col_lower or col_lower == 'home'):
-                    home_col = col
-                elif 'away' in col_lower or 'visit' in col_lower:
-                    away_col = col
+            date_col = next((c for c in GAME_LOG_DATE_COLUMNS if c in game_logs.columns), None)
+            home_col = _last_matching_column(columns, HOME_TEAM_RE)
+            away_col = _last_matching_column(columns, AWAY_TEAM_RE, exclude=HOME_TEAM_RE)
 
             # Create umpire ID from name if not available
             umpire_map = pd.DataFrame()
@@ -628,64 +1238,98 @@ class DataLoader:
             if hp_ump_col:
                 umpire_map['umpire_name'] = game_logs[hp_ump_col]
                 # Create numeric ID from name hash
-                umpire_map['umpire_id'] = umpire_map['umpire_name'].apply(
-                    lambda x: abs(hash(str(x))) % 1000000 if pd.notna(x) else 0
-                )
+                umpire_map['umpire_id'] = _umpire_ids_from_names(umpire_map['umpire_name'])
             elif hp_ump_id_col:
                 umpire_map['umpire_id'] = game_logs[hp_ump_id_col]
                 umpire_map['umpire_name'] = umpire_map['umpire_id'].astype(str)
 
             # Remove rows without umpire data
-            umpire_map = umpire_map.dropna(subset=['umpire_name'])
-            umpire_map = umpire_map[umpire_map['umpire_name'] != '']
+            umpire_map = umpire_map[~_unknown_umpire_mask(umpire_map['umpire_name'])]
 
             # If we have pitch_data with game_pk, build a mapping from (date, teams) to game_pk
             if pitch_data is not None and 'game_pk' in pitch_data.columns:
                 logger.info("Building game_pk mapping from pitch data...")
                 # Get unique games from pitch data
                 if 'home_team' in pitch_data.columns and 'away_team' in pitch_data.columns:
-                    game_pk_map = pitch_data.groupby(['game_date', 'home_team', 'away_team'])['game_pk'].first().reset_index()
-                    game_pk_map['date'] = pd.to_datetime(game_pk_map['game_date']).dt.strftime('%Y-%m-%d')
-                    game_pk_map = game_pk_map[['date', 'home_team', 'away_team', 'game_pk']]
-
-                    # Merge game_pk into umpire_map
-                    umpire_map = umpire_map.merge(
+                    # One game_pk per game, so the first row of each game is
+                    # enough; a hash scan rather than a groupby index build
+                    game_keys = ['game_date', 'home_team', 'away_team']
+                    game_pk_map = (pitch_data[game_keys + ['game_pk']]
+                                   .dropna(subset=game_keys)
+                                   .drop_duplicates(subset=game_keys))
+                    game_pk_map = game_pk_map.assign(_day=self._day_numbers(game_pk_map['game_date']))
+                    game_pk_map = game_pk_map[['_day', 'home_team', 'away_team', 'game_pk']]
+
+                    # Merge game_pk into umpire_map, matching dates as day numbers
+                    umpire_map = umpire_map.assign(_day=self._day_numbers(umpire_map['date'])).merge(
                         game_pk_map,
-                        on=['date', 'home_team', 'away_team'],
+                        on=['_day', 'home_team', 'away_team'],
                         how='left'
-                    )
+                    ).drop(columns=['_day'])
                     logger.info(f"Added game_pk to {(umpire_map['game_pk'].notna()).sum()} umpire assignments")
 
-            # Save to cache
+            # Save to cache, keeping any games a concurrent season saved
+            # while these logs were downloading
             if len(umpire_map) > 0:
-                try:
-                    umpire_map.to_parquet(cache_file, index=False)
-                    logger.info(f"Cached {len(umpire_map)} umpire game assignments")
-                except Exception as e:
-                    logger.warning(f"Could not cache umpire data: {e}")
+                with self._umpire_cache_lock:
+                    try:
+                        if os.path.exists(cache_file):
+                            game_keys = [c for c in ('date', 'home_team', 'away_team') if c in umpire_map.columns]
+                            umpire_map = pd.concat(
+                                [pd.read_parquet(cache_file), umpire_map], ignore_index=True
+                            ).drop_duplicates(subset=game_keys or None, keep='last')
+                        umpire_map.to_parquet(cache_file, index=False)
+                        logger.info(f"Cached {len(umpire_map)} umpire game assignments")
+                    except Exception as e:
+                        logger.warning(f"Could not cache umpire data: {e}")
 
             return umpire_map
 
         except Exception as e:
-            logger.error(f"Error loading umpire data: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error loading umpire data: {e}")
             return None
 
-    def _load_from_disk_cache(self, year: int) -> pd.DataFrame:
+    def _load_from_disk_cache(self, year: int, filters: list = None,
+                              columns: list = None) -> pd.DataFrame:
         """
         Load cached data from disk.
+
+        Args:
+            year: Season year
+            filters: Optional pyarrow filter predicates, e.g.
+                [('batter', '=', 660271)]. Row groups whose min/max
+                statistics exclude the predicate are skipped entirely.
+            columns: Optional column projection; only these column chunks
+                are read from the file. Defaults to SEASON_COLUMNS.
         """
         cache_file = os.path.join(self.DATA_DIR, self.FULL_SEASON_PATTERN.format(year=year))
 
         if os.path.exists(cache_file):
             try:
                 logger.info(f"Loading cached data from {cache_file}")
-                data = pd.read_parquet(cache_file)
+                available = set(pq.read_schema(cache_file).names)
+                projection = [c for c in (columns or SEASON_COLUMNS) if c in available]
+                if filters or columns:
+                    data = pq.read_table(
+                        cache_file, columns=projection, filters=filters or None, memory_map=True
+                    ).to_pandas()
+                    logger.info(f"Loaded {len(data)} matching pitches from cache (filters={filters})")
+                    return data
+                data = self._load_arrow_mirror(year, cache_file)
+                if data is None:
+                    table = pq.read_table(cache_file, columns=projection, memory_map=True)
+                    self._write_arrow_mirror(table, year)
+                    data = table.to_pandas()
                 logger.info(f"Loaded {len(data)} pitches from cache")
                 return data
             except Exception as e:
                 logger.warning(f"Error loading cache file: {e}")
+                if filters or columns:
+                    return None
+
+        if filters or columns:
+            # Predicate pushdown and projection are only available for parquet
+            return None
 
         # Also check for CSV format
         csv_file = cache_file.replace('.parquet', '.csv')
@@ -701,6 +1345,50 @@ class DataLoader:
 
         return None
 
+    def _load_arrow_mirror(self, year: int, cache_file: str) -> pd.DataFrame:
+        """
+        Load a season from its memory-mapped Arrow IPC mirror.
+
+        Numeric columns without nulls come back as views on the mapped
+        pages, so concurrent workers do not each hold a private copy.
+        Returns None if the mirror is missing or older than the parquet.
+        """
+        mirror_file = os.path.join(self.ARROW_DIR, self.ARROW_MIRROR_PATTERN.format(year=year))
+
+        if not os.path.exists(mirror_file) or os.path.getmtime(mirror_file) < os.path.getmtime(cache_file):
+            return None
+
+        try:
+            source = pa.memory_map(mirror_file, 'r')
+            table = pa.ipc.open_file(source).read_all()
+            logger.info(f"Memory-mapped season data from {mirror_file}")
+            return table.to_pandas(split_blocks=True)
+        except Exception as e:
+            logger.warning(f"Error reading Arrow mirror: {e}")
+            return None
+
+    def _write_arrow_mirror(self, table: pa.Table, year: int):
+        """
+        Write the Arrow IPC mirror read by _load_arrow_mirror.
+
+        Written to a temporary file and renamed into place so workers
+        starting concurrently never map a partial file.
+        """
+        mirror_file = os.path.join(self.ARROW_DIR, self.ARROW_MIRROR_PATTERN.format(year=year))
+        tmp_file = f"{mirror_file}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(self.ARROW_DIR, exist_ok=True)
+            with pa.OSFile(tmp_file, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_file, mirror_file)
+            logger.info(f"Wrote Arrow mirror {mirror_file}")
+        except Exception as e:
+            logger.warning(f"Could not write Arrow mirror: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
     def _save_to_disk_cache(self, data: pd.DataFrame, year: int):
         """
         Save data to disk cache for future use.
@@ -708,17 +1396,39 @@ class DataLoader:
         cache_file = os.path.join(self.DATA_DIR, self.FULL_SEASON_PATTERN.format(year=year))
 
         try:
-            # Save as parquet for efficiency
-            data.to_parquet(cache_file, index=False)
-            logger.info(f"Saved {len(data)} pitches to {cache_file}")
+            # Low-cardinality strings are stored as categoricals so parquet
+            # writes them dictionary/RLE encoded and they reload as category dtype.
+            # Rows are sorted by batter so batter predicates prune row groups
+            # and the season loads ready for range slicing.
+            frame = self._sort_by_batter(self._optimize_dtypes(data))
+            # The schema is inferred once over the whole season, so a slice
+            # where an object column happens to be all null still matches
+            schema = pa.Schema.from_pandas(frame, preserve_index=False)
+            metadata = {**(schema.metadata or {}),
+                        CACHE_UNIQUE_BATTERS_KEY: str(frame['batter'].nunique()).encode()}
+            if 'umpire_id' in frame.columns:
+                unique_umpires = np.count_nonzero(pd.unique(frame['umpire_id']) != 0)
+                metadata[CACHE_UNIQUE_UMPIRES_KEY] = str(unique_umpires).encode()
+            if self._has_umpire_data(data):
+                metadata[CACHE_SCHEMA_KEY] = CACHE_SCHEMA_VERSION
+            schema = schema.with_metadata(metadata)
+
+            def write(tmp_file):
+                with pq.ParquetWriter(tmp_file, schema, compression=PARQUET_COMPRESSION,
+                                      compression_level=PARQUET_COMPRESSION_LEVEL) as writer:
+                    for start in range(0, len(frame), PARQUET_WRITE_BATCH_ROWS):
+                        batch = frame.iloc[start:start + PARQUET_WRITE_BATCH_ROWS]
+                        writer.write_table(
+                            pa.Table.from_pandas(batch, schema=schema, preserve_index=False),
+                            row_group_size=PARQUET_ROW_GROUP_SIZE
+                        )
+
+            # Other workers read (and may be rewriting) the live season file,
+            # so the new one is written aside and renamed over it
+            if self._replace_file(cache_file, write):
+                logger.info(f"Saved {len(data)} pitches to {cache_file}")
         except Exception as e:
-            # Fall back to CSV if parquet fails
-            csv_file = cache_file.replace('.parquet', '.csv')
-            try:
-                data.to_csv(csv_file, index=False)
-                logger.info(f"Saved {len(data)} pitches to {csv_file}")
-            except Exception as e2:
-                logger.warning(f"Could not save cache: {e2}")
+            logger.warning(f"Could not save cache: {e}")
 
     def download_season_data(self, year: int = 2024, force: bool = False):
         """
@@ -755,35 +1465,52 @@ class DataLoader:
 
         IMPORTANT: In Statcast data, 'player_name' is the PITCHER's name, not the batter's.
         We need to look up batter names separately using pybaseball or use cached lookups.
+
+        The result is kept in a sidecar parquet next to the season cache, so
+        warm calls skip loading the season and the name lookups.
         """
-        data = self.get_data(year=year)
+        sidecar = os.path.join(self.DATA_DIR, self.BATTERS_SIDECAR_PATTERN.format(year=year))
+        cached = self._read_batters_sidecar(sidecar, self._season_mtime(year))
+        if cached is not None:
+            return cached
+
+        data = self._season_projection(year, ['batter', 'pitcher', 'plate_x', 'stand'])
 
         if data is None or len(data) == 0:
             return pd.DataFrame(columns=['batter_id', 'name', 'pitch_count'])
 
         # Get set of all pitcher IDs from the data
         # Anyone who pitched is considered a pitcher and excluded from batter list
-        pitcher_ids = set(data['pitcher'].unique())
+        pitcher_ids = pd.unique(data['pitcher'].to_numpy())
         logger.info(f"Found {len(pitcher_ids)} unique pitchers to exclude from batter list")
 
-        # Get all unique batter IDs, their pitch counts, and batting sides
-        batter_counts = data.groupby('batter').agg({
-            'plate_x': 'count',
-            'stand': lambda x: list(x.unique())  # Get all batting sides used
-        }).reset_index()
-        batter_counts.columns = ['batter_id', 'pitch_count', 'bat_sides']
-
-        # Determine if switch hitter (bats from both sides)
-        batter_counts['is_switch_hitter'] = batter_counts['bat_sides'].apply(lambda x: len(x) > 1)
-
-        # Exclude pitchers from the batter list
+        # Exclude pitchers before grouping, so the group reduce only hashes
+        # position players
         # A position player is someone who batted but never pitched
-        position_players = batter_counts[~batter_counts['batter_id'].isin(pitcher_ids)]
+        data = data[~np.isin(data['batter'].to_numpy(), pitcher_ids)]
+
+        # Get all unique batter IDs and their pitch counts
+        position_players = (data.groupby('batter', observed=True)['plate_x'].count()
+                            .rename_axis('batter_id').reset_index(name='pitch_count'))
         logger.info(f"After excluding pitchers: {len(position_players)} position players remain")
 
         # Filter to batters with meaningful sample sizes (at least 100 pitches seen)
         position_players = position_players[position_players['pitch_count'] >= 100]
 
+        # Batting sides used, in order of first appearance, for the remaining
+        # batters only; a (batter, side) dedupe leaves at most two rows each
+        sides = data[['batter', 'stand']].drop_duplicates()
+        sides = sides[sides['batter'].isin(position_players['batter_id'])]
+        bat_sides = {}
+        for batter, side in zip(sides['batter'].tolist(), sides['stand'].tolist()):
+            bat_sides.setdefault(batter, []).append(side)
+        # Switch hitters bat from both sides
+        switch_hitters = {batter: len(used) > 1 for batter, used in bat_sides.items()}
+        position_players = position_players.assign(
+            bat_sides=position_players['batter_id'].map(bat_sides),
+            is_switch_hitter=position_players['batter_id'].map(switch_hitters).astype(bool)
+        )
+
         # Sort by pitch count descending
         position_players = position_players.sort_values('pitch_count', ascending=False)
 
@@ -791,24 +1518,142 @@ class DataLoader:
         # Try to use pybaseball's playerid_reverse_lookup if available
         batter_names = self._get_batter_names(position_players['batter_id'].tolist())
 
-        # Merge names with the position players dataframe
-        position_players = position_players.merge(
-            batter_names,
-            on='batter_id',
-            how='left'
-        )
+        # Names are unique per batter_id, so a dict lookup replaces the merge
+        name_map = dict(zip(batter_names['batter_id'].tolist(), batter_names['name'].tolist()))
+        position_players['name'] = position_players['batter_id'].map(name_map)
 
         # Fill any missing names with "Player {id}"
-        position_players['name'] = position_players['name'].fillna(
-            position_players['batter_id'].apply(lambda x: f"Player {x}")
+        position_players['name'] = position_players['name'].mask(
+            position_players['name'].isna(), 'Player ' + position_players['batter_id'].astype(str)
         )
 
-        # Remove any duplicates
-        position_players = position_players.drop_duplicates(subset=['batter_id'], keep='first')
-
         logger.info(f"Returning {len(position_players)} position player batters with names")
 
-        return position_players[['batter_id', 'name', 'pitch_count', 'bat_sides', 'is_switch_hitter']]
+        position_players = position_players[['batter_id', 'name', 'pitch_count', 'bat_sides', 'is_switch_hitter']]
+        self._write_batters_sidecar(position_players, sidecar, self._season_mtime(year))
+        return position_players
+
+    def _season_projection(self, year: int, columns: list) -> pd.DataFrame:
+        """
+        A season's rows projected onto columns.
+
+        When the season is not in memory and its parquet is an enriched
+        cache, only those column chunks are read from disk, rather than
+        loading the whole season into memory.
+        """
+        if f"{year}_all" not in self._data_cache and self._is_enriched_cache(year):
+            data = self._load_from_disk_cache(year, columns=columns)
+            if data is not None:
+                return self._optimize_dtypes(data)
+        return self.get_data(year=year, columns=columns)
+
+    def _parquet_date_range(self, year: int) -> Optional[tuple]:
+        """
+        (min, max) game_date of the season parquet, read from its row-group
+        statistics. None if the file or any row group's statistics are missing.
+        """
+        cache_file = os.path.join(self.DATA_DIR, self.FULL_SEASON_PATTERN.format(year=year))
+        try:
+            metadata = pq.ParquetFile(cache_file).metadata
+            paths = [metadata.schema.column(i).path for i in range(metadata.num_columns)]
+            column = paths.index('game_date')
+        except Exception:
+            return None
+
+        lows, highs = [], []
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(column).statistics
+            if stats is None or not stats.has_min_max:
+                return None
+            lows.append(stats.min)
+            highs.append(stats.max)
+        if not lows:
+            return None
+        return pd.Timestamp(min(lows)), pd.Timestamp(max(highs))
+
+    def _parquet_unique_counts(self, year: int) -> Optional[tuple]:
+        """
+        (unique_batters, unique_umpires) stored in an enriched season
+        parquet's metadata by _save_to_disk_cache, or None if absent.
+        """
+        cache_file = os.path.join(self.DATA_DIR, self.FULL_SEASON_PATTERN.format(year=year))
+        try:
+            metadata = pq.read_schema(cache_file).metadata or {}
+            if metadata.get(CACHE_SCHEMA_KEY) != CACHE_SCHEMA_VERSION:
+                return None
+            return int(metadata[CACHE_UNIQUE_BATTERS_KEY]), int(metadata[CACHE_UNIQUE_UMPIRES_KEY])
+        except Exception:
+            return None
+
+    def season_version(self, year: int) -> Optional[str]:
+        """
+        Stamp of the season parquet that changes whenever it is rewritten.
+
+        Another process (such as a different gunicorn worker serving
+        /api/data/download) may rewrite the file; when the stamp moves, this
+        process's in-memory copy of the season is dropped, so callers that
+        key their own caches on the stamp recompute from the new data.
+        """
+        version = self._season_mtime(year)
+        with self._filtered_lock:
+            previous = self._season_versions.get(year, version)
+            self._season_versions[year] = version
+        if previous != version:
+            logger.info(f"Season {year} cache file changed, dropping in-memory data")
+            self.clear_cache(year)
+        return version
+
+    def _season_mtime(self, year: int) -> Optional[str]:
+        """Modification time of the season parquet as a sidecar stamp, or None."""
+        cache_file = os.path.join(self.DATA_DIR, self.FULL_SEASON_PATTERN.format(year=year))
+        try:
+            return repr(os.path.getmtime(cache_file))
+        except OSError:
+            return None
+
+    @staticmethod
+    def _replace_file(path: str, write) -> bool:
+        """
+        Call write(tmp_path), then rename the temporary file over path.
+
+        Readers see either the old file or the complete new one. Returns
+        whether path was replaced.
+        """
+        tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            write(tmp_file)
+            os.replace(tmp_file, path)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not write {path}: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return False
+
+    @staticmethod
+    def _read_batters_sidecar(path: str, source_mtime: Optional[str]) -> Optional[pd.DataFrame]:
+        """Batter list from its sidecar, or None if missing or stale."""
+        if source_mtime is None or not os.path.exists(path):
+            return None
+        try:
+            table = pq.read_table(path)
+            if (table.schema.metadata or {}).get(b'source_mtime') != source_mtime.encode():
+                return None
+            batters = table.to_pandas()
+        except Exception as e:
+            logger.warning(f"Could not read batter sidecar: {e}")
+            return None
+        # Parquet list columns come back as arrays
+        batters['bat_sides'] = batters['bat_sides'].apply(list)
+        return batters
+
+    def _write_batters_sidecar(self, batters: pd.DataFrame, path: str, source_mtime: Optional[str]):
+        """Persist the batter list stamped with the season parquet's mtime."""
+        if source_mtime is None:
+            return
+        table = pa.Table.from_pandas(batters, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b'source_mtime': source_mtime.encode()})
+        self._replace_file(path, lambda tmp_file: pq.write_table(table, tmp_file))
 
     def _get_batter_names(self, batter_ids: list) -> pd.DataFrame:
         """
@@ -816,24 +1661,25 @@ class DataLoader:
 
         Returns DataFrame with columns: batter_id, name
         """
-        # Check for cached name lookups
+        # Check for cached name lookups; the parquet is read once per
+        # process and then served from memory
         cache_file = os.path.join(self.DATA_DIR, 'player_names_cache.parquet')
 
-        cached_names = None
-        if os.path.exists(cache_file):
-            try:
-                cached_names = pd.read_parquet(cache_file)
-                logger.info(f"Loaded {len(cached_names)} cached player names")
-            except Exception as e:
-                logger.warning(f"Could not load name cache: {e}")
+        with self._player_names_lock:
+            if self._player_names is None:
+                self._player_names = {}
+                if os.path.exists(cache_file):
+                    try:
+                        cached_names = pd.read_parquet(cache_file)
+                        self._player_names = dict(zip(cached_names['batter_id'].tolist(),
+                                                      cached_names['name'].tolist()))
+                        logger.info(f"Loaded {len(cached_names)} cached player names")
+                    except Exception as e:
+                        logger.warning(f"Could not load name cache: {e}")
+            names = self._player_names
 
         # Find which IDs we need to look up
-        if cached_names is not None:
-            cached_ids = set(cached_names['batter_id'].tolist())
-            missing_ids = [bid for bid in batter_ids if bid not in cached_ids]
-        else:
-            cached_names = pd.DataFrame(columns=['batter_id', 'name'])
-            missing_ids = batter_ids
+        missing_ids = [bid for bid in batter_ids if bid not in names]
 
         # Look up missing names using pybaseball
         if missing_ids and PYBASEBALL_AVAILABLE:
@@ -846,35 +1692,60 @@ class DataLoader:
                 lookup_result = playerid_reverse_lookup(missing_ids, key_type='mlbam')
 
                 if lookup_result is not None and len(lookup_result) > 0:
-                    new_names = pd.DataFrame({
-                        'batter_id': lookup_result['key_mlbam'].astype(int),
-                        'name': lookup_result['name_first'] + ' ' + lookup_result['name_last']
-                    })
-
-                    # Combine with cached names
-                    cached_names = pd.concat([cached_names, new_names], ignore_index=True)
-                    cached_names = cached_names.drop_duplicates(subset=['batter_id'], keep='first')
-
-                    # Save updated cache
-                    try:
-                        cached_names.to_parquet(cache_file, index=False)
-                        logger.info(f"Saved {len(cached_names)} player names to cache")
-                    except Exception as e:
-                        logger.warning(f"Could not save name cache: {e}")
+                    new_names = dict(zip(
+                        lookup_result['key_mlbam'].astype(int).tolist(),
+                        (lookup_result['name_first'] + ' ' + lookup_result['name_last']).tolist()
+                    ))
+
+                    # Combine with cached names (existing entries win) and
+                    # save the cache only when it gained names
+                    with self._player_names_lock:
+                        added = {k: v for k, v in new_names.items() if k not in names}
+                        names.update(added)
+                        snapshot = pd.DataFrame({'batter_id': list(names), 'name': list(names.values())})
+
+                    if added:
+                        try:
+                            snapshot.to_parquet(cache_file, index=False)
+                            logger.info(f"Saved {len(snapshot)} player names to cache")
+                        except Exception as e:
+                            logger.warning(f"Could not save name cache: {e}")
 
             except Exception as e:
                 logger.warning(f"Error looking up player names: {e}")
 
         # Filter to only requested IDs
-        result = cached_names[cached_names['batter_id'].isin(batter_ids)]
-
-        return result
+        found = [bid for bid in dict.fromkeys(batter_ids) if bid in names]
+        return pd.DataFrame({'batter_id': found, 'name': [names[bid] for bid in found]},
+                            columns=['batter_id', 'name'])
 
     def get_data_summary(self, year: int = 2024) -> dict:
         """
         Get summary statistics for available data.
+
+        Cached in a JSON sidecar next to the season parquet (see
+        get_available_batters).
         """
-        data = self.get_data(year=year)
+        sidecar = os.path.join(self.DATA_DIR, self.SUMMARY_SIDECAR_PATTERN.format(year=year))
+        source_mtime = self._season_mtime(year)
+        if source_mtime is not None and os.path.exists(sidecar):
+            try:
+                with open(sidecar) as f:
+                    cached = json.load(f)
+                if cached.get('source_mtime') == source_mtime:
+                    return cached['summary']
+            except Exception as e:
+                logger.warning(f"Could not read summary sidecar: {e}")
+
+        # The date range comes from the parquet footer when it can, so
+        # game_date is only read (and scanned) when it cannot
+        # Likewise the distinct batter and umpire counts, so only description
+        # is read when the season was written with them
+        date_range = self._parquet_date_range(year)
+        unique_counts = self._parquet_unique_counts(year)
+        columns = (['description'] + ([] if unique_counts else ['batter', 'umpire_id'])
+                   + ([] if date_range else ['game_date']))
+        data = self._season_projection(year, columns)
 
         if data is None or len(data) == 0:
             return {
@@ -886,75 +1757,101 @@ class DataLoader:
                 'data_source': 'none'
             }
 
+        # One hashed pass over description; every count below is read off it
+        counts = data['description'].value_counts()
         take_descriptions = ['called_strike', 'ball', 'blocked_ball', 'pitchout']
-        takes = data[data['description'].isin(take_descriptions)]
-        swings = data[~data['description'].isin(take_descriptions)]
+        takes = int(counts.reindex(take_descriptions, fill_value=0).sum())
+        in_play_descriptions = ['hit_into_play', 'hit_into_play_score', 'hit_into_play_no_out']
 
-        # Count unique umpires (excluding placeholder 0)
-        unique_umpires = 0
-        if 'umpire_id' in data.columns:
-            umpire_ids = data['umpire_id'].unique()
-            unique_umpires = len([u for u in umpire_ids if u != 0])
+        if unique_counts:
+            unique_batters, unique_umpires = unique_counts
+        else:
+            unique_batters = data['batter'].nunique()
+            # Count unique umpires (excluding placeholder 0)
+            unique_umpires = 0
+            if 'umpire_id' in data.columns:
+                unique_umpires = int(np.count_nonzero(pd.unique(data['umpire_id']) != 0))
 
-        return {
+        if date_range is None and 'game_date' in data.columns:
+            date_range = (data['game_date'].min(), data['game_date'].max())
+
+        summary = {
             'total_pitches': len(data),
-            'takes': len(takes),
-            'swings': len(swings),
-            'unique_batters': data['batter'].nunique(),
+            'takes': takes,
+            'swings': len(data) - takes,
+            'unique_batters': unique_batters,
             'unique_umpires': unique_umpires,
             'date_range': {
-                'start': str(data['game_date'].min().date()) if 'game_date' in data.columns else None,
-                'end': str(data['game_date'].max().date()) if 'game_date' in data.columns else None
+                'start': str(date_range[0].date()) if date_range else None,
+                'end': str(date_range[1].date()) if date_range else None
             },
             'zone_stats': {
-                'called_strikes': len(data[data['description'] == 'called_strike']),
-                'balls': len(data[data['description'] == 'ball']),
-                'swinging_strikes': len(data[data['description'] == 'swinging_strike']),
-                'foul': len(data[data['description'] == 'foul']),
-                'in_play': len(data[data['description'].str.contains('hit_into_play', na=False)])
+                'called_strikes': int(counts.get('called_strike', 0)),
+                'balls': int(counts.get('ball', 0)),
+                'swinging_strikes': int(counts.get('swinging_strike', 0)),
+                'foul': int(counts.get('foul', 0)),
+                'in_play': int(counts.reindex(in_play_descriptions, fill_value=0).sum())
             },
             'data_source': 'statcast'
         }
 
+        source_mtime = self._season_mtime(year)
+        if source_mtime is not None:
+            def write(tmp_file):
+                with open(tmp_file, 'w') as f:
+                    json.dump({'source_mtime': source_mtime, 'summary': summary}, f)
+            self._replace_file(sidecar, write)
+
+        return summary
+
     def _generate_fallback_data(self) -> pd.DataFrame:
         """
         Generate minimal fallback data if Statcast is unavailable.
         This should rarely be needed.
         """
         logger.warning("Generating fallback sample data - real data unavailable")
+        return _fallback_frame().copy()
 
-        np.random.seed(42)
-        n_pitches = 2000
-
-        # Simplified fallback with realistic distributions
-        data = {
-            'game_date': pd.date_range('2024-04-01', periods=n_pitches, freq='H'),
-            'batter': np.random.choice([660271, 605141, 592450, 665742, 543685], n_pitches),
-            'player_name': np.random.choice(['Shohei Ohtani', 'Mookie Betts', 'Aaron Judge', 'Juan Soto', 'Freddie Freeman'], n_pitches),
-            'pitcher': np.random.randint(400000, 700000, n_pitches),
-            'stand': np.random.choice(['L', 'R'], n_pitches),
-            'p_throws': np.random.choice(['L', 'R'], n_pitches, p=[0.27, 0.73]),
-            'plate_x': np.random.normal(0, 0.5, n_pitches),
-            'plate_z': np.random.normal(2.5, 0.6, n_pitches),
-            'sz_top': np.random.normal(3.5, 0.2, n_pitches),
-            'sz_bot': np.random.normal(1.5, 0.15, n_pitches),
-            'description': np.random.choice(
-                ['called_strike', 'ball', 'swinging_strike', 'foul', 'hit_into_play'],
-                n_pitches, p=[0.18, 0.35, 0.10, 0.22, 0.15]
-            ),
-            'pitch_type': np.random.choice(['FF', 'SL', 'CH', 'CU', 'SI'], n_pitches, p=[0.35, 0.25, 0.15, 0.15, 0.10]),
-            'release_speed': np.random.normal(92, 5, n_pitches),
-            'umpire_id': np.random.choice([427266, 484159, 484520], n_pitches),
-            'zone': np.random.randint(1, 15, n_pitches)
-        }
 
-        df = pd.DataFrame(data)
-        df['type'] = df['description'].map({
-            'called_strike': 'S', 'ball': 'B', 'swinging_strike': 'S',
-            'foul': 'S', 'hit_into_play': 'X'
-        })
+@lru_cache(maxsize=1)
+def _fallback_frame() -> pd.DataFrame:
+    """
+    Synthetic pitch data served when Statcast is unavailable.
 
-        return df
+    Built once with a seeded PCG64 generator; callers receive copies.
+    """
+    rng = np.random.default_rng(42)
+    n_pitches = 2000
+
+    # Simplified fallback with realistic distributions
+    data = {
+        'game_date': pd.date_range('2024-04-01', periods=n_pitches, freq='h'),
+        'batter': rng.choice([660271, 605141, 592450, 665742, 543685], n_pitches),
+        'player_name': rng.choice(['Shohei Ohtani', 'Mookie Betts', 'Aaron Judge', 'Juan Soto', 'Freddie Freeman'], n_pitches),
+        'pitcher': rng.integers(400000, 700000, n_pitches),
+        'stand': rng.choice(['L', 'R'], n_pitches),
+        'p_throws': rng.choice(['L', 'R'], n_pitches, p=[0.27, 0.73]),
+        'plate_x': rng.normal(0, 0.5, n_pitches),
+        'plate_z': rng.normal(2.5, 0.6, n_pitches),
+        'sz_top': rng.normal(3.5, 0.2, n_pitches),
+        'sz_bot': rng.normal(1.5, 0.15, n_pitches),
+        'description': rng.choice(
+            ['called_strike', 'ball', 'swinging_strike', 'foul', 'hit_into_play'],
+            n_pitches, p=[0.18, 0.35, 0.10, 0.22, 0.15]
+        ),
+        'pitch_type': rng.choice(['FF', 'SL', 'CH', 'CU', 'SI'], n_pitches, p=[0.35, 0.25, 0.15, 0.15, 0.10]),
+        'release_speed': rng.normal(92, 5, n_pitches),
+        'umpire_id': rng.choice([427266, 484159, 484520], n_pitches),
+        'zone': rng.integers(1, 15, n_pitches)
+    }
+
+    df = pd.DataFrame(data)
+    df['type'] = df['description'].map({
+        'called_strike': 'S', 'ball': 'B', 'swinging_strike': 'S',
+        'foul': 'S', 'hit_into_play': 'X'
+    })
+
+    return df
 
 
 # Convenience function for downloading data
@@ -969,9 +1866,17 @@ def download_data(years: list = None, force: bool = False):
         years = [2024]
 
     loader = DataLoader()
-    for year in years:
+
+    def download(year):
         print(f"Downloading {year} data...")
-        success = loader.download_season_data(year, force=force)
+        return loader.download_season_data(year, force=force)
+
+    # Each season writes its own cache file, so the network-bound season
+    # downloads overlap
+    with ThreadPoolExecutor(max_workers=max(1, min(len(years), 4))) as executor:
+        results = list(executor.map(download, years))
+
+    for year, success in zip(years, results):
         if success:
             print(f"  Success! Data cached for {year}")
         else:
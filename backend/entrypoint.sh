@@ -25,8 +25,12 @@ echo "Starting Gunicorn server..."
 echo "=================================================="
 
 # Start the Flask app with Gunicorn
+# Threaded workers keep long SZAS/Bayesian requests from blocking others;
+# workers share season data through the memory-mapped Arrow mirror
 exec gunicorn --bind 0.0.0.0:5000 \
-    --workers ${GUNICORN_WORKERS:-2} \
+    --workers ${GUNICORN_WORKERS:-4} \
+    --worker-class ${GUNICORN_WORKER_CLASS:-gthread} \
+    --threads ${GUNICORN_THREADS:-4} \
     --timeout ${GUNICORN_TIMEOUT:-120} \
     --access-logfile - \
     --error-logfile - \
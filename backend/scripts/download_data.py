@@ -18,7 +18,7 @@ Examples:
 import argparse
 import sys
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add parent directory to path for imports
@@ -28,13 +28,20 @@ from data_loader import DataLoader
 
 
 def backup_existing_cache(data_dir: str, year: int):
-    """Backup existing cache file before re-downloading."""
+    """
+    Backup existing cache file before re-downloading.
+
+    The cache is moved rather than copied, since the download rewrites it;
+    the original file becomes the backup. If the download then fails, main()
+    moves the backup back into place, so a failed refresh never leaves the
+    season without a cache file.
+    """
     cache_file = os.path.join(data_dir, f"statcast_{year}_full.parquet")
     if os.path.exists(cache_file):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = os.path.join(data_dir, f"statcast_{year}_full.backup_{timestamp}.parquet")
-        print(f"  Backing up existing cache to: {backup_file}")
-        shutil.copy2(cache_file, backup_file)
+        print(f"  Moving existing cache to backup: {backup_file}")
+        os.replace(cache_file, backup_file)
         return backup_file
     return None
 
@@ -79,19 +86,35 @@ def main():
     print("=" * 60)
     print()
 
-    for year in years:
-        print(f"Downloading {year} season data...")
-        print("-" * 40)
-
+    def download(year):
         # Backup existing cache if requested
+        backup_file = None
         if args.force and args.backup:
-            backup_existing_cache(loader.DATA_DIR, year)
+            backup_file = backup_existing_cache(loader.DATA_DIR, year)
 
         success = loader.download_season_data(year=year, force=args.force)
 
+        # Restore the previous cache if the download did not replace it
+        if not success and backup_file is not None:
+            cache_file = os.path.join(loader.DATA_DIR, f"statcast_{year}_full.parquet")
+            print(f"  Download failed, restoring {backup_file}")
+            os.replace(backup_file, cache_file)
+
+        # Get summary to show what was downloaded
+        return success, loader.get_data_summary(year=year) if success else None
+
+    # Each season writes its own cache file, so the network-bound season
+    # downloads overlap; results are reported in year order
+    print(f"Downloading {', '.join(str(year) for year in years)} season data...")
+    print()
+    with ThreadPoolExecutor(max_workers=min(len(years), 4)) as executor:
+        results = list(executor.map(download, years))
+
+    for year, (success, summary) in zip(years, results):
+        print(f"{year} season")
+        print("-" * 40)
+
         if success:
-            # Get summary to show what was downloaded
-            summary = loader.get_data_summary(year=year)
             print(f"  Total pitches: {summary['total_pitches']:,}")
             print(f"  Unique batters: {summary['unique_batters']:,}")
             print(f"  Unique umpires: {summary['unique_umpires']:,}")
@@ -8,16 +8,308 @@ Implements the Strike Zone Alignment Score calculation including:
 - IoU and divergence calculations
 """
 
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
 from scipy.stats import gaussian_kde
 from scipy.ndimage import gaussian_filter
 import warnings
 
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
+# Try to import numba for the compiled KDE grid, logistic fit and zone comparison kernels
+try:
+    from numba import njit, prange
+    from numba import config as numba_config
+    NUMBA_AVAILABLE = True
+    # Parallel kernels (here and in app.py, which imports this module first)
+    # are entered concurrently from request threads and the zone model pool;
+    # the default workqueue layer aborts the process when that happens, so
+    # require a threadsafe layer (tbb, or omp) unless NUMBA_THREADING_LAYER
+    # names one. Must be set before the first launch.
+    if numba_config.THREADING_LAYER == 'default':
+        numba_config.THREADING_LAYER = 'threadsafe'
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _parallel_probe(n):
+    """Smallest parallel kernel; launching it starts numba's threading layer"""
+    total = 0
+    for i in prange(n):
+        total += i
+    return total
+
+
+# Whether kernels may use parallel=True: False when no threadsafe threading
+# layer is installed (neither tbb nor libgomp), in which case they run serially
+NUMBA_PARALLEL = False
+if NUMBA_AVAILABLE:
+    try:
+        njit(parallel=True, cache=True)(_parallel_probe)(2)
+        NUMBA_PARALLEL = True
+    except ValueError:
+        logger.warning("No threadsafe numba threading layer (tbb or omp) available; running kernels serially")
+
+
+def _kde_grid_kernel(xs, zs, gx, gz, inv_cov, norm):
+    """
+    Evaluate a 2D Gaussian KDE at each point of the grid gz (rows) x gx (columns).
+
+    Equivalent to scipy's gaussian_kde(points) with the same inv_cov, but
+    runs as one fused loop per grid point instead of building the full
+    (grid x pitches) distance matrix, and takes the 1-D grid axes rather
+    than every grid point's coordinates.
+    """
+    a = inv_cov[0, 0]
+    b = inv_cov[0, 1] + inv_cov[1, 0]
+    c = inv_cov[1, 1]
+    out = np.empty((gz.shape[0], gx.shape[0]))
+    for i in prange(gz.shape[0]):
+        for k in range(gx.shape[0]):
+            total = 0.0
+            for j in range(xs.shape[0]):
+                dx = xs[j] - gx[k]
+                dz = zs[j] - gz[i]
+                total += np.exp(-0.5 * (a * dx * dx + b * dx * dz + c * dz * dz))
+            out[i, k] = total * norm
+    return out
+
+
+def _fit_quadratic_logit(px, pz, y, penalty, max_iter, tol):
+    """
+    Fit P(y | px, pz) = sigmoid(b . (1, px, pz, px^2, pz^2, px*pz)) by Newton
+    iterations (IRLS).
+
+    Minimizes the same objective as sklearn's LogisticRegression with
+    C = 1 / penalty: log loss plus an L2 penalty on every coefficient but the
+    intercept. Returns the six coefficients.
+    """
+    n = px.shape[0]
+    X = np.empty((n, 6))
+    X[:, 0] = 1.0
+    X[:, 1] = px
+    X[:, 2] = pz
+    X[:, 3] = px * px
+    X[:, 4] = pz * pz
+    X[:, 5] = px * pz
+    ridge = np.full(6, penalty)
+    ridge[0] = 0.0
+    beta = np.zeros(6)
+    for _ in range(max_iter):
+        p = 1.0 / (1.0 + np.exp(-(X @ beta)))
+        gradient = X.T @ (p - y) + ridge * beta
+        hessian = X.T @ (X * (p * (1.0 - p)).reshape(n, 1)) + np.diag(ridge)
+        step = np.linalg.solve(hessian, gradient)
+        beta = beta - step
+        if np.max(np.abs(step)) < tol:
+            break
+    return beta
+
+
+def _iou_kernel(zone1, zone2, threshold):
+    """Intersection and union cell counts of two thresholded zones, in one pass"""
+    intersection = 0
+    union = 0
+    for i in range(zone1.shape[0]):
+        for j in range(zone1.shape[1]):
+            in1 = zone1[i, j] >= threshold
+            in2 = zone2[i, j] >= threshold
+            if in1 and in2:
+                intersection += 1
+            if in1 or in2:
+                union += 1
+    return intersection, union
+
+
+def _divergence_kernel(zone1, zone2):
+    """Mean absolute difference of two zones, accumulated in float64"""
+    total = 0.0
+    for i in range(zone1.shape[0]):
+        for j in range(zone1.shape[1]):
+            total += abs(np.float64(zone1[i, j]) - np.float64(zone2[i, j]))
+    return total / zone1.size
+
+
+def _centroid_kernel(zone, x_values, z_values):
+    """Total weight and x/z first moments of a zone over 1-D grid coordinates"""
+    total = 0.0
+    moment_x = 0.0
+    moment_z = 0.0
+    for i in range(zone.shape[0]):
+        row = 0.0
+        for j in range(zone.shape[1]):
+            weight = np.float64(zone[i, j])
+            row += weight
+            moment_x += weight * x_values[j]
+        total += row
+        moment_z += row * z_values[i]
+    return total, moment_x, moment_z
+
+
+def _zone_metrics_kernel(textbook, umpire, batter, x_values, z_values, threshold):
+    """
+    Every post-modeling metric of calculate_szas in one pass over the zones.
+
+    Returns IoU intersection/union cell counts for the textbook-umpire,
+    textbook-batter and umpire-batter pairs, the textbook-umpire and
+    textbook-batter mean absolute differences, and a (3, 3) array of
+    (total weight, x moment, z moment) rows for textbook, umpire and batter.
+    """
+    inter_tu = union_tu = inter_tb = union_tb = inter_ub = union_ub = 0
+    diff_u = 0.0
+    diff_b = 0.0
+    moments = np.zeros((3, 3))
+    for i in range(textbook.shape[0]):
+        for j in range(textbook.shape[1]):
+            t = np.float64(textbook[i, j])
+            u = np.float64(umpire[i, j])
+            b = np.float64(batter[i, j])
+            in_t = textbook[i, j] >= threshold
+            in_u = umpire[i, j] >= threshold
+            in_b = batter[i, j] >= threshold
+            if in_t and in_u:
+                inter_tu += 1
+            if in_t or in_u:
+                union_tu += 1
+            if in_t and in_b:
+                inter_tb += 1
+            if in_t or in_b:
+                union_tb += 1
+            if in_u and in_b:
+                inter_ub += 1
+            if in_u or in_b:
+                union_ub += 1
+            diff_u += abs(t - u)
+            diff_b += abs(t - b)
+            moments[0, 0] += t
+            moments[0, 1] += t * x_values[j]
+            moments[0, 2] += t * z_values[i]
+            moments[1, 0] += u
+            moments[1, 1] += u * x_values[j]
+            moments[1, 2] += u * z_values[i]
+            moments[2, 0] += b
+            moments[2, 1] += b * x_values[j]
+            moments[2, 2] += b * z_values[i]
+    return (inter_tu, union_tu, inter_tb, union_tb, inter_ub, union_ub,
+            diff_u / textbook.size, diff_b / textbook.size, moments)
+
+
+if NUMBA_AVAILABLE:
+    _kde_grid_kernel = njit(parallel=NUMBA_PARALLEL, fastmath=True, cache=True)(_kde_grid_kernel)
+    _fit_quadratic_logit = njit(cache=True)(_fit_quadratic_logit)
+    _iou_kernel = njit(cache=True)(_iou_kernel)
+    _divergence_kernel = njit(fastmath=True, cache=True)(_divergence_kernel)
+    _centroid_kernel = njit(fastmath=True, cache=True)(_centroid_kernel)
+    _zone_metrics_kernel = njit(fastmath=True, cache=True)(_zone_metrics_kernel)
+
+
+# Shared pool for fitting the umpire zone while the calling thread fits the
+# batter zone; the fits spend their time in numpy/scipy/numba, outside the GIL
+ZONE_MODEL_WORKERS = 4
+_zone_model_executor = ThreadPoolExecutor(max_workers=ZONE_MODEL_WORKERS, thread_name_prefix='szas-zone')
+
+# Pitch descriptions that count as takes / swings
+TAKE_DESCRIPTIONS = frozenset(['called_strike', 'ball', 'blocked_ball', 'pitchout'])
+SWING_DESCRIPTIONS = frozenset(['swinging_strike', 'swinging_strike_blocked', 'foul',
+                                'foul_tip', 'hit_into_play', 'hit_into_play_score',
+                                'hit_into_play_no_out', 'foul_bunt', 'missed_bunt'])
+# 0/1 indicator columns added by SZASCalculator._prepare_data
+INDICATOR_COLUMNS = ['is_take', 'is_swing', 'is_called_strike', 'is_ball']
+# DataFrame.attrs flag set on frames SZASCalculator._prepare_data returns
+PREPARED_ATTR = '_szas_prepared'
+
+
+@dataclass
+class PitchSplit:
+    """
+    Location and call arrays for one subset (takes or swings) of the
+    prepared pitches, aligned by position.
+    """
+    x: np.ndarray
+    z: np.ndarray
+    is_called_strike: np.ndarray
+    is_ball: np.ndarray
+
+    @classmethod
+    def from_mask(cls, pitch_data: pd.DataFrame, mask: np.ndarray) -> 'PitchSplit':
+        return cls(*(pitch_data[col].to_numpy()[mask]
+                     for col in ('plate_x', 'plate_z', 'is_called_strike', 'is_ball')))
+
+    def __len__(self):
+        return len(self.x)
+
+
+@lru_cache(maxsize=8)
+def _zone_grid(x_min, x_max, z_min, z_max, size):
+    """
+    Read-only open grid for the given bounds: a (1, size) row of x values
+    and a (size, 1) column of z values, which broadcast to the full grid.
+    Zones are float32 throughout; they only feed thresholds, means and plots.
+    """
+    x_grid = np.linspace(x_min, x_max, size, dtype=np.float32).reshape(1, size)
+    z_grid = np.linspace(z_min, z_max, size, dtype=np.float32).reshape(size, 1)
+    x_grid.flags.writeable = False
+    z_grid.flags.writeable = False
+    return x_grid, z_grid
+
+
+@lru_cache(maxsize=64)
+def _textbook_zone(rows: tuple, cols: tuple, shape: tuple) -> np.ndarray:
+    """Read-only smoothed strike zone over (start, stop) row and column spans"""
+    zone = np.zeros(shape, dtype=np.float32)
+    zone[rows[0]:rows[1], cols[0]:cols[1]] = 1
+
+    # Smooth edges slightly for better visualization
+    zone = gaussian_filter(zone, sigma=0.5)
+    zone.flags.writeable = False
+    return zone
+
+
+@lru_cache(maxsize=8)
+def _batter_fallback_cached(textbook_bytes: bytes, shape: tuple) -> np.ndarray:
+    """Read-only slightly expanded textbook zone, from its float32 bytes and shape"""
+    textbook_zone = np.frombuffer(textbook_bytes, dtype=np.float32).reshape(shape)
+    zone = gaussian_filter(textbook_zone, sigma=2)
+    zone = zone / (zone.max() + 1e-6)
+    zone.flags.writeable = False
+    return zone
+
+
+def _batter_fallback(textbook_zone: np.ndarray) -> np.ndarray:
+    """Batter zone used when there are too few swings to model (memoized)"""
+    return _batter_fallback_cached(textbook_zone.astype(np.float32, copy=False).tobytes(),
+                                   textbook_zone.shape)
+
+
+def _mask_span(mask: np.ndarray) -> tuple:
+    """The (start, stop) index range a contiguous boolean mask covers"""
+    hits = np.flatnonzero(mask)
+    if len(hits) == 0:
+        return 0, 0
+    return int(hits[0]), int(hits[-1]) + 1
+
+
+def _grid_shape(x_grid, z_grid):
+    """(rows, cols) of the full grid an open grid broadcasts to"""
+    return z_grid.shape[0], x_grid.shape[1]
+
+
+def _grid_points(x_grid, z_grid):
+    """Flattened x and z coordinates of every grid point (row-major)"""
+    shape = _grid_shape(x_grid, z_grid)
+    return np.broadcast_to(x_grid, shape).ravel(), np.broadcast_to(z_grid, shape).ravel()
+
 
 class SZASCalculator:
     """Calculator for Strike Zone Alignment Score"""
@@ -33,8 +325,31 @@ class SZASCalculator:
     Z_MAX = 4.5
     GRID_SIZE = 50
 
+    # L2 penalty (1 / C) and Newton iteration cap for the umpire zone logit
+    UMPIRE_ZONE_PENALTY = 1.0
+    UMPIRE_ZONE_MAX_ITER = 50
+
+    # Fitted zones are memoized for the most recent pitch sets, since the UI
+    # requests both the score and the surfaces for the same selection
+    ZONE_CACHE_SIZE = 32
+    # Input columns the fitted zones depend on (the memo key hashes these)
+    ZONE_KEY_COLUMNS = ['plate_x', 'plate_z', 'px', 'pz', 'sz_top', 'sz_bot', 'description']
+
     def __init__(self):
-        self.scaler = StandardScaler()
+        self._zone_cache = OrderedDict()
+        self._zone_cache_lock = threading.Lock()
+        if NUMBA_AVAILABLE:
+            # Compile (or load from cache) the kernels before the first request
+            one = np.zeros(1)
+            one32 = np.zeros(1, dtype=np.float32)
+            _kde_grid_kernel(one32, one32, one, one, np.eye(2), 1.0)
+            _fit_quadratic_logit(one, one, one, 1.0, 1, 1e-8)
+            cell = np.zeros((1, 1), dtype=np.float32)
+            axis = np.zeros(1, dtype=np.float32)
+            _iou_kernel(cell, cell, np.float32(0.5))
+            _divergence_kernel(cell, cell)
+            _centroid_kernel(cell, axis, axis)
+            _zone_metrics_kernel(cell, cell, cell, axis, axis, np.float32(0.5))
 
     def calculate_szas(self, pitch_data: pd.DataFrame) -> dict:
         """
@@ -46,45 +361,24 @@ class SZASCalculator:
         Returns:
             Dictionary with SZAS score and component metrics
         """
-        # Clean and prepare data
-        pitch_data = self._prepare_data(pitch_data)
-
-        # Get average strike zone bounds
-        sz_top = pitch_data['sz_top'].mean() if 'sz_top' in pitch_data.columns else 3.5
-        sz_bot = pitch_data['sz_bot'].mean() if 'sz_bot' in pitch_data.columns else 1.5
-
-        # Create probability grids for each zone
-        x_grid, z_grid = self._create_grid()
-
-        # Model textbook zone (binary)
-        textbook_zone = self._model_textbook_zone(x_grid, z_grid, sz_top, sz_bot)
+        (n_pitches, sz_top, sz_bot, x_grid, z_grid, textbook_zone,
+         takes, swings, umpire_zone, batter_zone) = self._get_zones(pitch_data)
 
         # Model umpire zone from takes
-        takes = pitch_data[pitch_data['is_take'] == 1].copy()
-        if len(takes) >= 50:
-            umpire_zone = self._model_umpire_zone(takes, x_grid, z_grid)
-        else:
-            # Fallback to textbook zone with slight randomization
-            umpire_zone = textbook_zone * (1 + np.random.normal(0, 0.1, textbook_zone.shape))
-            umpire_zone = np.clip(umpire_zone, 0, 1)
+        if umpire_zone is None:
+            # Fallback to textbook zone with softened edges (deterministic)
+            umpire_zone = gaussian_filter(textbook_zone, sigma=1.0).astype(np.float32)
 
         # Model batter zone from swings
-        swings = pitch_data[pitch_data['is_swing'] == 1].copy()
-        if len(swings) >= 50:
-            batter_zone = self._model_batter_zone(swings, x_grid, z_grid)
-        else:
+        if batter_zone is None:
             # Fallback to slightly expanded textbook zone
-            batter_zone = gaussian_filter(textbook_zone, sigma=2)
-            batter_zone = batter_zone / batter_zone.max()
-
-        # Calculate IoU scores
-        iou_textbook_umpire = self._calculate_iou(textbook_zone, umpire_zone)
-        iou_textbook_batter = self._calculate_iou(textbook_zone, batter_zone)
-        iou_umpire_batter = self._calculate_iou(umpire_zone, batter_zone)
+            batter_zone = _batter_fallback(textbook_zone)
 
-        # Calculate divergence metrics
-        divergence_umpire = self._calculate_zone_divergence(textbook_zone, umpire_zone)
-        divergence_batter = self._calculate_zone_divergence(textbook_zone, batter_zone)
+        # Calculate IoU scores, divergence metrics and zone centroids
+        (iou_textbook_umpire, iou_textbook_batter, iou_umpire_batter,
+         divergence_umpire, divergence_batter,
+         textbook_centroid, umpire_centroid, batter_centroid) = self._zone_metrics(
+            textbook_zone, umpire_zone, batter_zone, x_grid, z_grid)
 
         # Calculate influence bias (regression check)
         influence_bias = self._calculate_influence_bias(takes, swings)
@@ -93,11 +387,6 @@ class SZASCalculator:
         avg_iou = (iou_textbook_umpire + iou_textbook_batter + iou_umpire_batter) / 3
         szas = avg_iou * (1 - abs(influence_bias))
 
-        # Calculate zone centroids
-        textbook_centroid = self._calculate_centroid(textbook_zone, x_grid, z_grid)
-        umpire_centroid = self._calculate_centroid(umpire_zone, x_grid, z_grid)
-        batter_centroid = self._calculate_centroid(batter_zone, x_grid, z_grid)
-
         return {
             'szas': round(szas, 4),
             'components': {
@@ -118,11 +407,11 @@ class SZASCalculator:
                 'sz_bot': round(sz_bot, 3)
             },
             'data_stats': {
-                'total_pitches': len(pitch_data),
+                'total_pitches': n_pitches,
                 'takes': len(takes),
                 'swings': len(swings),
-                'called_strikes': len(takes[takes['is_called_strike'] == 1]) if 'is_called_strike' in takes.columns else 0,
-                'balls': len(takes[takes['is_ball'] == 1]) if 'is_ball' in takes.columns else 0
+                'called_strikes': int(np.count_nonzero(takes.is_called_strike)),
+                'balls': int(np.count_nonzero(takes.is_ball))
             },
             'interpretation': self._interpret_szas(szas, iou_textbook_umpire, iou_textbook_batter)
         }
@@ -131,58 +420,110 @@ class SZASCalculator:
         """
         Get probability surfaces for visualization
 
-        Returns grid data suitable for heatmap plotting
+        Returns grid data suitable for heatmap plotting. Grids, axes and
+        pitch locations are numpy arrays; the API's JSON provider encodes
+        them directly, and they can also be sent as raw .npy buffers.
         """
-        pitch_data = self._prepare_data(pitch_data)
-
-        sz_top = pitch_data['sz_top'].mean() if 'sz_top' in pitch_data.columns else 3.5
-        sz_bot = pitch_data['sz_bot'].mean() if 'sz_bot' in pitch_data.columns else 1.5
-
-        x_grid, z_grid = self._create_grid()
+        (n_pitches, sz_top, sz_bot, x_grid, z_grid, textbook_zone,
+         takes, swings, umpire_zone, batter_zone) = self._get_zones(pitch_data)
 
-        textbook_zone = self._model_textbook_zone(x_grid, z_grid, sz_top, sz_bot)
-
-        takes = pitch_data[pitch_data['is_take'] == 1]
-        if len(takes) >= 50:
-            umpire_zone = self._model_umpire_zone(takes, x_grid, z_grid)
-        else:
+        if umpire_zone is None:
             umpire_zone = textbook_zone.copy()
 
-        swings = pitch_data[pitch_data['is_swing'] == 1]
-        if len(swings) >= 50:
-            batter_zone = self._model_batter_zone(swings, x_grid, z_grid)
-        else:
-            batter_zone = gaussian_filter(textbook_zone, sigma=2)
-            batter_zone = batter_zone / (batter_zone.max() + 1e-6)
+        if batter_zone is None:
+            batter_zone = _batter_fallback(textbook_zone)
 
         return {
-            'x_values': x_grid[0, :].tolist(),
-            'z_values': z_grid[:, 0].tolist(),
-            'textbook_zone': textbook_zone.tolist(),
-            'umpire_zone': umpire_zone.tolist(),
-            'batter_zone': batter_zone.tolist(),
+            'x_values': x_grid[0, :],
+            'z_values': z_grid[:, 0],
+            'textbook_zone': textbook_zone,
+            'umpire_zone': umpire_zone,
+            'batter_zone': batter_zone,
             'zone_bounds': {
-                'sz_top': round(sz_top, 3),
-                'sz_bot': round(sz_bot, 3),
+                'sz_top': round(float(sz_top), 3),
+                'sz_bot': round(float(sz_bot), 3),
                 'plate_left': -self.PLATE_WIDTH / 2,
                 'plate_right': self.PLATE_WIDTH / 2
             },
             'pitch_locations': {
                 'takes': {
-                    'x': takes['plate_x'].tolist() if len(takes) > 0 else [],
-                    'z': takes['plate_z'].tolist() if len(takes) > 0 else [],
-                    'is_strike': takes['is_called_strike'].tolist() if len(takes) > 0 and 'is_called_strike' in takes.columns else []
+                    'x': takes.x,
+                    'z': takes.z,
+                    'is_strike': takes.is_called_strike
                 },
                 'swings': {
-                    'x': swings['plate_x'].tolist() if len(swings) > 0 else [],
-                    'z': swings['plate_z'].tolist() if len(swings) > 0 else []
+                    'x': swings.x,
+                    'z': swings.z
                 }
             }
         }
 
+    def _get_zones(self, pitch_data: pd.DataFrame) -> tuple:
+        """
+        Prepare pitch_data and fit its zones.
+
+        Returns (prepared row count, sz_top, sz_bot, x_grid, z_grid, textbook_zone,
+        takes, swings, umpire_zone, batter_zone), with takes and swings as
+        PitchSplit arrays. umpire_zone / batter_zone
+        are None when there are fewer than 50 takes / swings to model, and
+        callers apply their own fallback. Results are memoized on a hash of
+        ZONE_KEY_COLUMNS and shared between calls, so treat them as read-only.
+        """
+        key = self._zone_key(pitch_data)
+        with self._zone_cache_lock:
+            zones = self._zone_cache.get(key)
+            if zones is not None:
+                self._zone_cache.move_to_end(key)
+                return zones
+
+        # Clean and prepare data
+        pitch_data = self._prepare_data(pitch_data)
+
+        # Get average strike zone bounds
+        sz_top = pitch_data['sz_top'].mean() if 'sz_top' in pitch_data.columns else 3.5
+        sz_bot = pitch_data['sz_bot'].mean() if 'sz_bot' in pitch_data.columns else 1.5
+
+        # Create probability grids for each zone
+        x_grid, z_grid = self._create_grid()
+
+        # Model textbook zone (binary)
+        textbook_zone = self._model_textbook_zone(x_grid, z_grid, sz_top, sz_bot)
+
+        # Model umpire zone from takes (on the pool) and batter zone from
+        # swings (here) concurrently; the two fits are independent
+        takes = PitchSplit.from_mask(pitch_data, pitch_data['is_take'].to_numpy() == 1)
+        swings = PitchSplit.from_mask(pitch_data, pitch_data['is_swing'].to_numpy() == 1)
+        umpire_future = None
+        if len(takes) >= 50:
+            umpire_future = _zone_model_executor.submit(self._model_umpire_zone, takes, x_grid, z_grid)
+        batter_zone = self._model_batter_zone(swings, x_grid, z_grid) if len(swings) >= 50 else None
+        umpire_zone = umpire_future.result() if umpire_future is not None else None
+
+        zones = (len(pitch_data), sz_top, sz_bot, x_grid, z_grid, textbook_zone,
+                 takes, swings, umpire_zone, batter_zone)
+        with self._zone_cache_lock:
+            self._zone_cache[key] = zones
+            while len(self._zone_cache) > self.ZONE_CACHE_SIZE:
+                self._zone_cache.popitem(last=False)
+        return zones
+
+    def _zone_key(self, pitch_data: pd.DataFrame) -> tuple:
+        """Memo key for _get_zones: a digest of the ZONE_KEY_COLUMNS values"""
+        columns = [c for c in self.ZONE_KEY_COLUMNS if c in pitch_data.columns]
+        row_hashes = pd.util.hash_pandas_object(pitch_data[columns], index=False).to_numpy()
+        digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+        return tuple(columns), len(pitch_data), digest
+
     def _prepare_data(self, pitch_data: pd.DataFrame) -> pd.DataFrame:
         """Clean and prepare pitch data"""
-        df = pitch_data.copy()
+        # Frames this method already returned (or row subsets of them, which
+        # keep their attrs) are passed through as they are
+        if pitch_data.attrs.get(PREPARED_ATTR) and all(c in pitch_data.columns for c in INDICATOR_COLUMNS):
+            return pitch_data
+
+        # Only the columns the zones use; the new frame owns its indicator
+        # and coerced columns, so the caller's frame is never modified
+        df = pitch_data[[c for c in self.ZONE_KEY_COLUMNS if c in pitch_data.columns]]
 
         # Rename columns if needed
         if 'plate_x' not in df.columns and 'px' in df.columns:
@@ -190,30 +531,38 @@ class SZASCalculator:
         if 'plate_z' not in df.columns and 'pz' in df.columns:
             df['plate_z'] = df['pz']
 
-        # Remove missing location data
-        df = df.dropna(subset=['plate_x', 'plate_z'])
-
         # Convert pandas nullable types to standard numpy types to avoid NAType issues
-        # This handles Float64 -> float64 and Int64 -> float64 conversions
+        # This handles Float64 -> float64 and Int64 -> float64 conversions;
+        # columns the loader already stores as numpy float32 are kept as-is
         numeric_cols = ['plate_x', 'plate_z', 'sz_top', 'sz_bot']
         for col in numeric_cols:
             if col in df.columns:
-                # Convert to standard float64, replacing NA with NaN
-                df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+                values = pd.to_numeric(df[col], errors='coerce')
+                if values.dtype not in (np.float32, np.float64):
+                    # Convert to standard float64, replacing NA with NaN
+                    values = values.astype('float64')
+                df[col] = values
 
-        # Drop any remaining NaN values in critical columns
+        # Remove missing (or unparseable) location data
         df = df.dropna(subset=['plate_x', 'plate_z'])
 
-        # Create indicator columns
-        take_descriptions = ['called_strike', 'ball', 'blocked_ball', 'pitchout']
-        swing_descriptions = ['swinging_strike', 'swinging_strike_blocked', 'foul',
-                              'foul_tip', 'hit_into_play', 'hit_into_play_score',
-                              'hit_into_play_no_out', 'foul_bunt', 'missed_bunt']
-
-        df['is_take'] = df['description'].isin(take_descriptions).astype(int)
-        df['is_swing'] = df['description'].isin(swing_descriptions).astype(int)
-        df['is_called_strike'] = (df['description'] == 'called_strike').astype(int)
-        df['is_ball'] = (df['description'] == 'ball').astype(int)
+        # Locations as float32, the precision the loader stores them in; the
+        # takes / swings splits and the KDE kernel read them at half the bytes
+        df['plate_x'] = df['plate_x'].astype(np.float32, copy=False)
+        df['plate_z'] = df['plate_z'].astype(np.float32, copy=False)
+
+        # Create indicator columns: classify each distinct description once,
+        # then gather the flags by category code. The extra last row is the
+        # all-zero flags for missing descriptions (code -1).
+        description = df['description'].astype('category')
+        categories = description.cat.categories
+        flags = np.zeros((len(categories) + 1, len(INDICATOR_COLUMNS)), dtype=np.int8)
+        for i, label in enumerate(categories):
+            flags[i] = (label in TAKE_DESCRIPTIONS, label in SWING_DESCRIPTIONS,
+                        label == 'called_strike', label == 'ball')
+        flags = flags[description.cat.codes.to_numpy()]
+        for i, col in enumerate(INDICATOR_COLUMNS):
+            df[col] = flags[:, i]
 
         # Set default zone bounds if missing, fill NaN values
         if 'sz_top' not in df.columns:
@@ -225,13 +574,12 @@ class SZASCalculator:
         else:
             df['sz_bot'] = df['sz_bot'].fillna(1.5)
 
+        df.attrs[PREPARED_ATTR] = True
         return df
 
     def _create_grid(self):
-        """Create coordinate grid for zone modeling"""
-        x = np.linspace(self.X_MIN, self.X_MAX, self.GRID_SIZE)
-        z = np.linspace(self.Z_MIN, self.Z_MAX, self.GRID_SIZE)
-        return np.meshgrid(x, z)
+        """Create coordinate grid for zone modeling (open grid, see _zone_grid)"""
+        return _zone_grid(self.X_MIN, self.X_MAX, self.Z_MIN, self.Z_MAX, self.GRID_SIZE)
 
     def _model_textbook_zone(self, x_grid, z_grid, sz_top, sz_bot) -> np.ndarray:
         """
@@ -241,118 +589,164 @@ class SZASCalculator:
         """
         half_plate = self.PLATE_WIDTH / 2 + self.BALL_RADIUS
 
-        # Binary zone
-        in_x = (x_grid >= -half_plate) & (x_grid <= half_plate)
-        in_z = (z_grid >= sz_bot - self.BALL_RADIUS) & (z_grid <= sz_top + self.BALL_RADIUS)
-
-        zone = (in_x & in_z).astype(float)
+        # Binary zone: the grid axes are sorted, so the zone is the rectangle
+        # of the column span of in_x and the row span of in_z. The smoothed
+        # zone is memoized on that span, and is shared and read-only.
+        in_x = (x_grid.ravel() >= -half_plate) & (x_grid.ravel() <= half_plate)
+        in_z = (z_grid.ravel() >= sz_bot - self.BALL_RADIUS) & (z_grid.ravel() <= sz_top + self.BALL_RADIUS)
 
-        # Smooth edges slightly for better visualization
-        zone = gaussian_filter(zone, sigma=0.5)
+        return _textbook_zone(_mask_span(in_z), _mask_span(in_x), _grid_shape(x_grid, z_grid))
 
-        return zone
-
-    def _model_umpire_zone(self, takes: pd.DataFrame, x_grid, z_grid) -> np.ndarray:
+    def _model_umpire_zone(self, takes: PitchSplit, x_grid, z_grid) -> np.ndarray:
         """
         Model the umpire's called strike zone using logistic regression
 
         P(strike | px, pz) = sigmoid(β0 + β1*px + β2*pz + interactions)
         """
         if len(takes) < 50:
-            return np.zeros_like(x_grid)
-
-        X = takes[['plate_x', 'plate_z']].values
-        y = takes['is_called_strike'].values
+            return np.zeros(_grid_shape(x_grid, z_grid), dtype=np.float32)
 
-        # Add polynomial features for better fit
-        X_poly = np.column_stack([
-            X,
-            X[:, 0] ** 2,  # px^2
-            X[:, 1] ** 2,  # pz^2
-            X[:, 0] * X[:, 1]  # interaction
-        ])
+        y = takes.is_called_strike.astype(np.float64)
 
         try:
-            # Fit logistic regression
-            model = LogisticRegression(max_iter=1000, C=1.0)
-            model.fit(X_poly, y)
-
-            # Predict on grid
-            grid_points = np.column_stack([x_grid.ravel(), z_grid.ravel()])
-            grid_poly = np.column_stack([
-                grid_points,
-                grid_points[:, 0] ** 2,
-                grid_points[:, 1] ** 2,
-                grid_points[:, 0] * grid_points[:, 1]
-            ])
-
-            probs = model.predict_proba(grid_poly)[:, 1]
-            zone = probs.reshape(x_grid.shape)
+            # A logit needs both outcomes to fit
+            if y.min() == y.max():
+                raise ValueError("takes are all strikes or all balls")
+
+            # Fit logistic regression with polynomial features (px^2, pz^2,
+            # px*pz) for better fit, C=1.0
+            beta = _fit_quadratic_logit(
+                takes.x.astype(np.float64), takes.z.astype(np.float64), y,
+                self.UMPIRE_ZONE_PENALTY, self.UMPIRE_ZONE_MAX_ITER, 1e-8
+            )
+            if not np.all(np.isfinite(beta)):
+                raise ValueError("logistic fit diverged")
+
+            # Predict on grid: the open grid broadcasts the features to the
+            # full (z, x) grid
+            x = x_grid.astype(np.float64)
+            z = z_grid.astype(np.float64)
+            logit = (beta[0] + beta[1] * x + beta[2] * z
+                     + beta[3] * x * x + beta[4] * z * z + beta[5] * x * z)
+            zone = (1.0 / (1.0 + np.exp(-logit))).astype(np.float32)
 
         except Exception:
             # Fallback to KDE
-            zone = self._kde_zone(takes, x_grid, z_grid, 'is_called_strike')
+            zone = self._kde_zone(takes.x, takes.z, x_grid, z_grid, mask=takes.is_called_strike == 1)
 
         return zone
 
-    def _model_batter_zone(self, swings: pd.DataFrame, x_grid, z_grid) -> np.ndarray:
+    def _model_batter_zone(self, swings: PitchSplit, x_grid, z_grid) -> np.ndarray:
         """
         Model the batter's swing zone
 
         P(swing | px, pz) based on swing density
         """
         if len(swings) < 50:
-            return np.zeros_like(x_grid)
+            return np.zeros(_grid_shape(x_grid, z_grid), dtype=np.float32)
 
         try:
             # Use KDE for swing density
-            xy = np.vstack([swings['plate_x'].values, swings['plate_z'].values])
-            kde = gaussian_kde(xy, bw_method='scott')
-
-            grid_points = np.vstack([x_grid.ravel(), z_grid.ravel()])
-            zone = kde(grid_points).reshape(x_grid.shape)
+            xy = np.vstack([swings.x, swings.z])
+            zone = self._evaluate_kde(xy, x_grid, z_grid)
 
             # Normalize to 0-1
             zone = zone / (zone.max() + 1e-6)
 
         except Exception:
-            zone = np.zeros_like(x_grid)
+            zone = np.zeros(_grid_shape(x_grid, z_grid), dtype=np.float32)
 
         return zone
 
-    def _kde_zone(self, data: pd.DataFrame, x_grid, z_grid, weight_col=None) -> np.ndarray:
+    def _evaluate_kde(self, xy: np.ndarray, x_grid, z_grid) -> np.ndarray:
+        """Gaussian KDE (Scott bandwidth) of 2 x N points evaluated on the grid, as float32"""
+        if not NUMBA_AVAILABLE:
+            kde = gaussian_kde(xy, bw_method='scott')
+            grid_points = np.vstack(_grid_points(x_grid, z_grid))
+            return kde(grid_points).reshape(_grid_shape(x_grid, z_grid)).astype(np.float32)
+
+        # Scott's rule, as gaussian_kde computes it: the kernel covariance is
+        # the data covariance scaled by factor ** 2, factor = n ** (-1 / (d + 4))
+        n = xy.shape[1]
+        covariance = np.cov(xy) * n ** (-2 / 6)
+        inv_cov = np.linalg.inv(covariance)
+        norm = 1.0 / (n * np.sqrt(np.linalg.det(2 * np.pi * covariance)))
+        density = _kde_grid_kernel(
+            np.ascontiguousarray(xy[0], dtype=np.float32),
+            np.ascontiguousarray(xy[1], dtype=np.float32),
+            np.ascontiguousarray(x_grid.ravel(), dtype=np.float64),
+            np.ascontiguousarray(z_grid.ravel(), dtype=np.float64),
+            np.ascontiguousarray(inv_cov, dtype=np.float64),
+            norm
+        )
+        return density.astype(np.float32)
+
+    def _kde_zone(self, x: np.ndarray, z: np.ndarray, x_grid, z_grid, mask=None) -> np.ndarray:
         """Create zone using kernel density estimation"""
         try:
-            if weight_col and weight_col in data.columns:
+            if mask is not None:
                 # Filter to positive cases only
-                positive = data[data[weight_col] == 1]
-                if len(positive) < 10:
-                    return np.zeros_like(x_grid)
-                xy = np.vstack([positive['plate_x'].values, positive['plate_z'].values])
-            else:
-                xy = np.vstack([data['plate_x'].values, data['plate_z'].values])
+                if np.count_nonzero(mask) < 10:
+                    return np.zeros(_grid_shape(x_grid, z_grid), dtype=np.float32)
+                x, z = x[mask], z[mask]
+            xy = np.vstack([x, z])
 
-            kde = gaussian_kde(xy, bw_method='scott')
-            grid_points = np.vstack([x_grid.ravel(), z_grid.ravel()])
-            zone = kde(grid_points).reshape(x_grid.shape)
+            zone = self._evaluate_kde(xy, x_grid, z_grid)
             zone = zone / (zone.max() + 1e-6)
 
         except Exception:
-            zone = np.zeros_like(x_grid)
+            zone = np.zeros(_grid_shape(x_grid, z_grid), dtype=np.float32)
 
         return zone
 
+    def _zone_metrics(self, textbook_zone, umpire_zone, batter_zone, x_grid, z_grid) -> tuple:
+        """
+        The three pairwise IoUs, the umpire and batter divergences from the
+        textbook zone, and the three zone centroids.
+
+        With numba this is a single fused kernel pass over the zones.
+        """
+        if not NUMBA_AVAILABLE:
+            return (
+                self._calculate_iou(textbook_zone, umpire_zone),
+                self._calculate_iou(textbook_zone, batter_zone),
+                self._calculate_iou(umpire_zone, batter_zone),
+                self._calculate_zone_divergence(textbook_zone, umpire_zone),
+                self._calculate_zone_divergence(textbook_zone, batter_zone),
+                self._calculate_centroid(textbook_zone, x_grid, z_grid),
+                self._calculate_centroid(umpire_zone, x_grid, z_grid),
+                self._calculate_centroid(batter_zone, x_grid, z_grid)
+            )
+
+        (inter_tu, union_tu, inter_tb, union_tb, inter_ub, union_ub,
+         divergence_umpire, divergence_batter, moments) = _zone_metrics_kernel(
+            textbook_zone, umpire_zone, batter_zone, x_grid.ravel(), z_grid.ravel(), np.float32(0.5))
+        return (
+            inter_tu / union_tu if union_tu else 0.0,
+            inter_tb / union_tb if union_tb else 0.0,
+            inter_ub / union_ub if union_ub else 0.0,
+            float(divergence_umpire),
+            float(divergence_batter),
+            *(self._centroid_from_moments(*row) for row in moments)
+        )
+
     def _calculate_iou(self, zone1: np.ndarray, zone2: np.ndarray, threshold=0.5) -> float:
         """
         Calculate Intersection over Union between two zones
 
         Uses threshold to convert probability zones to binary
         """
-        binary1 = zone1 >= threshold
-        binary2 = zone2 >= threshold
+        threshold = np.float32(threshold)
+        if NUMBA_AVAILABLE:
+            intersection, union = _iou_kernel(zone1, zone2, threshold)
+        else:
+            # Pack the thresholded zones into bitsets and popcount the AND / OR;
+            # packbits pads with zero bits, so the counts match the bool sums
+            bits1 = np.packbits(zone1 >= threshold)
+            bits2 = np.packbits(zone2 >= threshold)
 
-        intersection = np.logical_and(binary1, binary2).sum()
-        union = np.logical_or(binary1, binary2).sum()
+            intersection = int.from_bytes((bits1 & bits2).tobytes(), 'little').bit_count()
+            union = int.from_bytes((bits1 | bits2).tobytes(), 'little').bit_count()
 
         if union == 0:
             return 0.0
@@ -362,21 +756,35 @@ class SZASCalculator:
     def _calculate_zone_divergence(self, zone1: np.ndarray, zone2: np.ndarray) -> float:
         """Calculate normalized divergence between zones"""
         # Use mean absolute difference
+        if NUMBA_AVAILABLE:
+            return float(_divergence_kernel(zone1, zone2))
         diff = np.abs(zone1 - zone2)
-        return float(np.mean(diff))
+        return float(np.mean(diff, dtype=np.float64))
 
     def _calculate_centroid(self, zone: np.ndarray, x_grid, z_grid) -> dict:
         """Calculate weighted centroid of a zone"""
-        total_weight = zone.sum()
+        if NUMBA_AVAILABLE:
+            return self._centroid_from_moments(*_centroid_kernel(zone, x_grid.ravel(), z_grid.ravel()))
+
+        # Accumulate in float64; the elementwise products stay float32
+        total_weight = float(zone.sum(dtype=np.float64))
         if total_weight == 0:
             return {'x': 0, 'z': 2.5}
 
-        cx = (zone * x_grid).sum() / total_weight
-        cz = (zone * z_grid).sum() / total_weight
+        # Collapse one axis before weighting by the 1-D coordinates
+        cx = (zone.sum(axis=0) * x_grid.ravel()).sum(dtype=np.float64) / total_weight
+        cz = (zone.sum(axis=1) * z_grid.ravel()).sum(dtype=np.float64) / total_weight
 
         return {'x': round(float(cx), 3), 'z': round(float(cz), 3)}
 
-    def _calculate_influence_bias(self, takes: pd.DataFrame, swings: pd.DataFrame) -> float:
+    @staticmethod
+    def _centroid_from_moments(total_weight, moment_x, moment_z) -> dict:
+        """Centroid dict from a zone's total weight and x/z first moments"""
+        if total_weight == 0:
+            return {'x': 0, 'z': 2.5}
+        return {'x': round(float(moment_x / total_weight), 3), 'z': round(float(moment_z / total_weight), 3)}
+
+    def _calculate_influence_bias(self, takes: PitchSplit, swings: PitchSplit) -> float:
         """
         Check for influence between batter swing tendency and umpire calls
 